@@ -50,19 +50,30 @@ if sys.version_info < (3, 10):
         path=__file__,
     )
 
-if os.environ.get("PYDIAMOND_IMPORT_WARNINGS", "1") not in ("0", "1"):
-    raise ValueError(f"Invalid value for 'PYDIAMOND_IMPORT_WARNINGS', got {os.environ['PYDIAMOND_IMPORT_WARNINGS']!r}")
+import_warnings: str = os.environ.get("PYDIAMOND_IMPORT_WARNINGS", "1")
+if import_warnings not in ("0", "1"):
+    raise ValueError(f"Invalid value for 'PYDIAMOND_IMPORT_WARNINGS', got {import_warnings!r}")
+
+eager_import: str = os.environ.get("PYDIAMOND_EAGER_IMPORT", "0")
+if eager_import not in ("0", "1"):
+    raise ValueError(f"Invalid value for 'PYDIAMOND_EAGER_IMPORT', got {eager_import!r}")
+
+patch_debug: str = os.environ.get("PYDIAMOND_PATCH_DEBUG", "0")
+if patch_debug not in ("0", "1"):
+    raise ValueError(f"Invalid value for 'PYDIAMOND_PATCH_DEBUG', got {patch_debug!r}")
+_patch_debug: bool = patch_debug == "1"  # Applied patches are only recorded in __patches__ when set
 
 ############ Package initialization ############
 #### Apply various patch that must be run before importing the main modules
 from ._patch import PatchContext, collector
 
-collector.start_record()
+if _patch_debug:
+    collector.start_record()
 
 collector.run_patches(PatchContext.BEFORE_ALL)
 
 if any(name == "pygame" or name.startswith("pygame.") for name in list(sys.modules)):
-    if os.environ.get("PYDIAMOND_IMPORT_WARNINGS", "1") == "1":
+    if import_warnings == "1":
         import warnings as _warnings
 
         from .warnings import PyDiamondImportWarning
@@ -74,37 +85,76 @@ if any(name == "pygame" or name.startswith("pygame.") for name in list(sys.modul
 
 collector.run_patches(PatchContext.BEFORE_IMPORTING_PYGAME)
 
-try:
-    import pygame
-except ModuleNotFoundError as exc:
-    raise ModuleNotFoundError(
-        "'pygame' package must be installed in order to use the PyDiamond engine",
-        name=exc.name,
-        path=exc.path,
-    ) from exc
-
-collector.run_patches(PatchContext.AFTER_IMPORTING_PYGAME)
-
-collector.run_patches(PatchContext.BEFORE_IMPORTING_SUBMODULES)
-
-from . import (
-    audio as audio,
-    environ as environ,
-    graphics as graphics,
-    math as math,
-    network as network,
-    resource as resource,
-    system as system,
-    version as version,
-    warnings as warnings,
-    window as window,
+# pygame itself is imported by the subpackages which need it (see _bootstrap.ensure_pygame())
+
+############ Lazy submodules import ############
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import (
+        audio as audio,
+        environ as environ,
+        graphics as graphics,
+        math as math,
+        network as network,
+        resource as resource,
+        system as system,
+        version as version,
+        warnings as warnings,
+        window as window,
+    )
+
+_LAZY_SUBMODULES: frozenset[str] = frozenset(
+    {
+        "audio",
+        "environ",
+        "graphics",
+        "math",
+        "network",
+        "resource",
+        "system",
+        "version",
+        "warnings",
+        "window",
+    }
 )
 
-collector.run_patches(PatchContext.AFTER_IMPORTING_SUBMODULES)
 
-collector.run_patches(PatchContext.AFTER_ALL)
+def __getattr__(name: str) -> object:
+    if name not in _LAZY_SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    module = import_module(f".{name}", __name__)
+    globals()[name] = module
+    return module
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_SUBMODULES)
+
+
+def _load_all() -> None:
+    for name in sorted(_LAZY_SUBMODULES):
+        __getattr__(name)
+
+
+if eager_import == "1":
+    _load_all()
+
+    collector.run_patches(PatchContext.AFTER_IMPORTING_SUBMODULES)
+
+    collector.run_patches(PatchContext.AFTER_ALL)
+else:
+    # These patches must run after pygame has been imported: ensure_pygame() runs them with the first subpackage needing it
+    from ._bootstrap import defer_submodules_patches
+
+    defer_submodules_patches()
+
+    del defer_submodules_patches
 
-__patches__ = collector.stop_record()
+__patches__ = collector.stop_record()  # Always empty unless PYDIAMOND_PATCH_DEBUG is set
 
 ############ Cleanup ############
-del os, sys, pygame, collector, PatchContext
+del os, sys, collector, PatchContext, TYPE_CHECKING, import_warnings, eager_import, patch_debug
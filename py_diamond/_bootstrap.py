@@ -0,0 +1,78 @@
+# -*- coding: Utf-8 -*-
+# Copyright (c) 2021-2022, Francis Clairicia-Rose-Claire-Josephine
+#
+#
+"""PyDiamond's bootstrap module
+
+This module is intended for internal use, you would not have to use it.
+"""
+
+from __future__ import annotations
+
+__all__ = ["defer_submodules_patches", "ensure_pygame"]  # type: list[str]
+
+import sys
+
+_loaded: bool = False
+_deferred_patches: bool = False
+
+
+def defer_submodules_patches() -> None:
+    """
+    Postpone the AFTER_IMPORTING_SUBMODULES and AFTER_ALL patches until ensure_pygame() is called.
+
+    Called by the main package when its subpackages are lazily imported, so that the patch contexts
+    still run in order.
+    """
+    global _deferred_patches
+
+    if not _loaded:
+        _deferred_patches = True
+        return
+
+    from ._patch import PatchContext, collector
+
+    collector.run_patches(PatchContext.AFTER_IMPORTING_SUBMODULES)
+    collector.run_patches(PatchContext.AFTER_ALL)
+
+
+def ensure_pygame() -> None:
+    """
+    Import pygame and apply the patches depending on it.
+
+    Called at the top of every subpackage using pygame, so that the SDL initialization cost
+    is only paid when one of them is actually imported.
+    """
+    global _loaded, _deferred_patches
+
+    if _loaded:
+        return
+
+    from ._patch import PatchContext, collector
+
+    main_package = sys.modules[__package__]
+    new_record: bool = getattr(main_package, "_patch_debug", False) and collector.start_record()
+    try:
+        try:
+            import pygame
+        except ModuleNotFoundError as exc:
+            raise ModuleNotFoundError(
+                "'pygame' package must be installed in order to use the PyDiamond engine",
+                name=exc.name,
+                path=exc.path,
+            ) from exc
+
+        collector.run_patches(PatchContext.AFTER_IMPORTING_PYGAME)
+
+        collector.run_patches(PatchContext.BEFORE_IMPORTING_SUBMODULES)
+
+        if _deferred_patches:
+            _deferred_patches = False
+            collector.run_patches(PatchContext.AFTER_IMPORTING_SUBMODULES)
+            collector.run_patches(PatchContext.AFTER_ALL)
+    finally:
+        if new_record:
+            record = collector.stop_record()
+            setattr(main_package, "__patches__", getattr(main_package, "__patches__", frozenset()) | record)
+
+    _loaded = True
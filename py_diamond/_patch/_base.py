@@ -8,13 +8,7 @@ from __future__ import annotations
 
 __all__ = ["BasePatch"]
 
-import importlib
-import inspect
-import os
-import re
-import sys
 import typing
-import warnings
 from abc import ABCMeta, abstractmethod
 from enum import IntEnum, auto, unique
 
@@ -37,6 +31,8 @@ class PatchContext(IntEnum):
 
 
 class BasePatch(metaclass=ABCMeta):
+    __slots__ = ()
+
     DISABLED_PATCHES: typing.ClassVar[set[str]] = set()
     DISABLED_CONTEXTS: typing.ClassVar[set[PatchContext]] = set()
     ENABLE_PATCH: typing.ClassVar[bool] = True
@@ -56,7 +52,9 @@ class BasePatch(metaclass=ABCMeta):
             return True
         if not BasePatch.ENABLE_PATCH:
             return False
-        return cls.get_name() not in BasePatch.DISABLED_PATCHES and cls.get_required_context() not in BasePatch.DISABLED_CONTEXTS
+        if BasePatch.DISABLED_CONTEXTS and cls.get_required_context() in BasePatch.DISABLED_CONTEXTS:
+            return False
+        return not BasePatch.DISABLED_PATCHES or cls.get_name() not in BasePatch.DISABLED_PATCHES
 
     def setup(self) -> None:
         pass
@@ -74,12 +72,25 @@ class RequiredPatch(BasePatch):
     Base class used to identify required patches
     """
 
+    __slots__ = ()
+
 
 def __read_environment() -> None:
+    import os
+
     patch_disable_value: str = os.environ.get("PYDIAMOND_PATCH_DISABLE", "")
     if patch_disable_value.lower() == "all":
         BasePatch.ENABLE_PATCH = False
         return
+    if not patch_disable_value.strip(" :"):
+        return
+
+    import importlib
+    import inspect
+    import re
+    import sys
+    import warnings
+
     invalid_patches: dict[str, str] = dict()
     for patch_path in set(filter(None, (name.strip() for name in patch_disable_value.split(":")))):
         if match := re.match(r"context\[\s*(?P<contexts>\w+(?:\s*,\s*\w+)*)\s*\]", patch_path):
@@ -117,7 +128,7 @@ def __read_environment() -> None:
         if issubclass(patch_cls, RequiredPatch):
             invalid_patches[patch_path] = "It is a required patch and cannot be disabled"
             continue
-        BasePatch.DISABLED_PATCHES.add(patch_name)
+        BasePatch.DISABLED_PATCHES.add(patch_cls.get_name())
     if invalid_patches:
         msg = "Invalid instructions from environment:\n"
         msg += "\n".join(f"- {p}: {m}" for p, m in invalid_patches.items())
@@ -70,14 +70,15 @@ class _PatchCollectorType:
         return any(patch.__class__.enabled() for ctx in contexts for patch in self.__all_patches.get(ctx, ()))
 
     def run_patches(self, context: PatchContext) -> None:
+        patches = [patch for patch in self.__all_patches.get(context, ()) if patch.__class__.enabled()]
+        if not patches:  # Do not need to mock the imports then
+            return
         forbidden_imports = [
             module for module, context_ceiling in self.__forbidden_imports_until_context.items() if context < context_ceiling
         ]
         with self.mock_import(f"run ({context.name.replace('_', ' ').lower()})", forbidden_imports=forbidden_imports):
             # TODO (3.11): Exception groups
-            for patch in self.__all_patches.get(context, ()):
-                if not patch.__class__.enabled():
-                    continue
+            for patch in patches:
                 patch.setup()
                 try:
                     patch.run()
@@ -86,9 +87,11 @@ class _PatchCollectorType:
                 finally:
                     patch.teardown()
 
-    def start_record(self) -> None:
+    def start_record(self) -> bool:
         if self.__record is None:
             self.__record = set()
+            return True
+        return False
 
     def stop_record(self) -> frozenset[str]:
         record = self.__record
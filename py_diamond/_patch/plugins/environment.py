@@ -21,9 +21,12 @@ BOOLEAN_PYGAME_ENVIRONMENT_VARIABLES: Final[Sequence[str]] = (
     "SDL_VIDEO_CENTERED",
     "SDL_VIDEO_ALLOW_SCREENSAVER",
 )
+_BOOLEAN_PYGAME_ENVIRONMENT_VARIABLES_SET: Final[frozenset[str]] = frozenset(BOOLEAN_PYGAME_ENVIRONMENT_VARIABLES)
 
 
 class AbstractEnvironmentPatch(BasePatch):
+    __slots__ = ("environ",)
+
     def setup(self) -> None:
         super().setup()
 
@@ -37,6 +40,8 @@ class AbstractEnvironmentPatch(BasePatch):
 
 
 class ArrangePygameEnvironmentBeforeImport(AbstractEnvironmentPatch):
+    __slots__ = ()
+
     OVERRIDEN_VARIABLES: Final[MappingProxyType[str, str]] = MappingProxyType(
         {
             "PYGAME_HIDE_SUPPORT_PROMPT": "1",
@@ -65,6 +70,8 @@ class ArrangePygameEnvironmentBeforeImport(AbstractEnvironmentPatch):
 
 
 class VerifyBooleanEnvironmentVariables(AbstractEnvironmentPatch):
+    __slots__ = ()
+
     @classmethod
     def get_required_context(cls) -> PatchContext:
         return PatchContext.AFTER_IMPORTING_SUBMODULES
@@ -104,17 +111,22 @@ def check_booleans(
         only = tuple(set(only))
         if not only:
             raise ValueError("'only' argument: Empty sequence")
-    if unknown_vars := set(only) - set(BOOLEAN_PYGAME_ENVIRONMENT_VARIABLES):
+    if not _BOOLEAN_PYGAME_ENVIRONMENT_VARIABLES_SET.issuperset(only):
+        unknown_vars = set(only) - _BOOLEAN_PYGAME_ENVIRONMENT_VARIABLES_SET
         raise ValueError(f"Invalid environment variables for 'only' parameter: {', '.join(unknown_vars)}")
+    excluded: frozenset[str]
     if exclude is None:
-        exclude = ()
+        excluded = frozenset()
     elif isinstance(exclude, str):
-        exclude = (exclude,)
+        excluded = frozenset((exclude,))
     else:
-        exclude = tuple(set(exclude))
-    if unknown_vars := set(exclude) - set(BOOLEAN_PYGAME_ENVIRONMENT_VARIABLES):
+        excluded = frozenset(exclude)
+    if not _BOOLEAN_PYGAME_ENVIRONMENT_VARIABLES_SET.issuperset(excluded):
+        unknown_vars = excluded - _BOOLEAN_PYGAME_ENVIRONMENT_VARIABLES_SET
         raise ValueError(f"Invalid environment variables for 'exclude' parameter: {', '.join(unknown_vars)}")
-    for var in (var for var in only if var in environ and var not in exclude):
+    for var in only:
+        if var in excluded or var not in environ:
+            continue
         value = environ[var]
         if value not in ("0", "1"):
             raise ValueError(f"Invalid value for {var!r} environment variable: {value}")
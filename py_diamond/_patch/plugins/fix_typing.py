@@ -21,6 +21,8 @@ _T = TypeVar("_T")
 
 
 class OverrideFinalFunctionsPatch(BasePatch):
+    __slots__ = ("__default_final",)
+
     def setup(self) -> None:
         super().setup()
 
@@ -18,6 +18,8 @@ if TYPE_CHECKING:
 
 
 class PygamePatch(RequiredPatch):
+    __slots__ = ("event", "music")
+
     @classmethod
     def get_required_context(cls) -> PatchContext:
         return PatchContext.AFTER_IMPORTING_PYGAME
@@ -25,7 +25,9 @@ __all__ = [
     "Sound",
 ]
 
-import os
+from .._bootstrap import ensure_pygame
+
+ensure_pygame()
 
 import pygame
 
@@ -46,7 +48,7 @@ if SDL_MIXER_VERSION < (2, 0, 0):
     )
 
 ############ Cleanup ############
-del os, pygame
+del pygame, ensure_pygame
 
 
 ############ Package initialization ############
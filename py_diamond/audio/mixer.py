@@ -13,7 +13,7 @@ from __future__ import annotations
 
 __all__ = ["AllowedAudioChanges", "AudioFormat", "Mixer", "MixerParams"]
 
-from contextlib import ExitStack, contextmanager
+from contextlib import contextmanager
 from enum import IntEnum, IntFlag
 from typing import TYPE_CHECKING, Any, Iterator, Literal as L, NamedTuple, overload
 
@@ -28,6 +28,8 @@ from .sound import Channel
 if TYPE_CHECKING:
     from contextlib import _GeneratorContextManager
 
+_mixer_init_context_active: bool = False  # True while within a Mixer.init() context
+
 
 class AllowedAudioChanges(IntFlag):
     """
@@ -145,24 +147,32 @@ class Mixer(ClassNamespace, frozen=True):
         On context close, this will uninitialize pygame.mixer using pygame.mixer.quit().
         All playback will stop and any loaded Sound objects may not be compatible with the mixer if it is reinitialized later.
 
-        Raise pygame.error if pygame.mixer is already initialized
+        Raise pygame.error if pygame.mixer is already initialized.
+        pygame.mixer.quit() must not be called directly within the context.
 
         See more in pygame documentation: https://www.pygame.org/docs/ref/mixer.html#pygame.mixer.init
         """
+        global _mixer_init_context_active
+
         if _pg_mixer.get_init() is not None:
             raise _pg_error("Mixer module already initialized")
 
-        with ExitStack() as stack:
-            _pg_mixer.init(**kwargs)
-            stack.callback(_pg_mixer.quit)
-
+        _pg_mixer.init(**kwargs)
+        try:
             from .music import MusicStream
 
-            stack.callback(MusicStream.stop, unload=True)
-
-            init_params: MixerParams | None = Mixer.get_init()
-            assert init_params is not None
-            yield init_params
+            _mixer_init_context_active = True
+            try:
+                init_params: MixerParams | None = Mixer.get_init()
+                assert init_params is not None
+                yield init_params
+            finally:
+                try:
+                    MusicStream.stop(unload=True)
+                finally:
+                    _mixer_init_context_active = False
+        finally:
+            _pg_mixer.quit()
 
     @staticmethod
     def get_init() -> MixerParams | None:
@@ -176,6 +186,13 @@ class Mixer(ClassNamespace, frozen=True):
             return None
         return MixerParams._make(init_params)
 
+    @staticmethod
+    def _is_initialized() -> bool:
+        # Within a Mixer.init() context, the mixer is known to be initialized: skip the call to pygame.mixer.get_init()
+        # Limitation: a pygame.mixer.quit() call made within the context is not detected,
+        # so MusicStream.stop() would then raise pygame.error instead of returning silently.
+        return _mixer_init_context_active or _pg_mixer.get_init() is not None
+
     @staticmethod
     def is_busy() -> bool:
         """Test if any sound is being mixed
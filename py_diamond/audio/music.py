@@ -25,19 +25,16 @@ from itertools import chain
 from typing import TYPE_CHECKING, Any, Final
 from weakref import WeakValueDictionary
 
-import pygame.mixer as _pg_mixer
 from pygame import encode_file_path
-from pygame.event import Event as _PygameEvent
 from pygame.mixer import music as _pg_music
 
-if TYPE_CHECKING:
-    _PygameEventType = _PygameEvent
-else:
-    from pygame.event import EventType as _PygameEventType
-
 from ..system.namespace import ClassNamespace
 from ..system.non_copyable import NonCopyable
 from ..system.object import final
+from .mixer import Mixer
+
+if TYPE_CHECKING:
+    from pygame.event import Event as _PygameEvent
 
 
 @final
@@ -48,7 +45,7 @@ class Music(NonCopyable):
     There is only one attribute :filepath: which is the absolute path to the music file
     """
 
-    __slots__ = ("__f", "__weakref__")
+    __slots__ = ("__f", "__encoded_f", "__weakref__")
     __cache: Final[WeakValueDictionary[str, Music]] = WeakValueDictionary()
 
     def __new__(cls, filepath: str) -> Music:
@@ -64,6 +61,7 @@ class Music(NonCopyable):
         except KeyError:
             cls.__cache[filepath] = self = super().__new__(cls)
             self.__f = filepath
+            self.__encoded_f = encode_file_path(filepath)
         return self
 
     def __repr__(self) -> str:
@@ -89,6 +87,12 @@ class Music(NonCopyable):
         self.__f: str
         return self.__f
 
+    @property
+    def encoded_filepath(self, /) -> bytes:
+        """Music file path, encoded for pygame.mixer.music functions"""
+        self.__encoded_f: bytes
+        return self.__encoded_f
+
     def __reduce_ex__(self, __protocol: Any) -> str | tuple[Any, ...]:
         raise TypeError(f"cannot pickle {type(self).__qualname__!r} object")
 
@@ -101,7 +105,7 @@ class MusicStream(ClassNamespace, frozen=True):
     This class provides a high-level interface, which handles several queued musics (playlists) and keeps tracking running and queued sounds.
     """
 
-    @dataclass
+    @dataclass(slots=True)
     class _PlayingMusic:
         payload: _MusicPayload | None = None
         fadeout: bool = False
@@ -109,6 +113,7 @@ class MusicStream(ClassNamespace, frozen=True):
 
     __queue: deque[_MusicPayload] = deque()
     __playing: _PlayingMusic = _PlayingMusic()
+    __end_event: int = _pg_music.get_endevent()  # Cannot be changed afterwards (See PygamePatch)
 
     @staticmethod
     def play(music: Music, *, repeat: int = 0, fade_ms: int = 0) -> None:
@@ -136,7 +141,7 @@ class MusicStream(ClassNamespace, frozen=True):
             return
         MusicStream.__playing.payload = None
         MusicStream.stop()
-        _pg_music.load(encode_file_path(music.filepath))
+        _pg_music.load(music.encoded_filepath)
         _pg_music.play(loops=repeat, fade_ms=fade_ms)
         MusicStream.__playing.payload = _MusicPayload(music, repeat=repeat)
 
@@ -157,7 +162,7 @@ class MusicStream(ClassNamespace, frozen=True):
         if unload:
             MusicStream.__playing.stopped = None
         MusicStream.__playing.fadeout = False
-        if _pg_mixer.get_init():
+        if Mixer._is_initialized():
             _pg_music.stop()
             if unload:
                 _pg_music.unload()
@@ -254,8 +259,11 @@ class MusicStream(ClassNamespace, frozen=True):
         If volume is a negative value the volume will be set to 0.0.
         If the volume argument is greater than 1.0, the volume will be set to 1.0.
         """
-
-        volume = min(max(float(volume), 0), 1)
+        volume = float(volume)
+        if volume < 0:
+            volume = 0.0
+        elif volume > 1:
+            volume = 1.0
         return _pg_music.set_volume(volume)
 
     @staticmethod
@@ -276,14 +284,13 @@ class MusicStream(ClassNamespace, frozen=True):
             raise ValueError(f"The playing music loops infinitely, queued musics will not be set")
         queue: deque[_MusicPayload] = MusicStream.__queue
         if not queue:
-            _pg_music.queue(encode_file_path(music.filepath), loops=repeat)
+            _pg_music.queue(music.encoded_filepath, loops=repeat)
         queue.append(_MusicPayload(music, repeat=repeat))
 
     @staticmethod
     def _handle_event(event: _PygameEvent) -> bool:
-        match event:
-            case _PygameEventType(type=event_type) if event_type == _pg_music.get_endevent():
-                return MusicStream.__update(event)
+        if event.type == MusicStream.__end_event:
+            return MusicStream.__update(event)
         return True
 
     @staticmethod
@@ -308,13 +315,13 @@ class MusicStream(ClassNamespace, frozen=True):
                 MusicStream.__playing.payload = payload = queue.popleft()
                 next_music = payload.music
                 if queue:
-                    _pg_music.queue(encode_file_path(queue[0].music.filepath), loops=queue[0].repeat)
+                    _pg_music.queue(queue[0].music.encoded_filepath, loops=queue[0].repeat)
         setattr(event, "finished", played_music.music)
         setattr(event, "next", next_music)
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class _MusicPayload:
     music: Music
     repeat: int = field(kw_only=True)
@@ -115,8 +115,9 @@ __all__ = [
     "save_image",
 ]
 
-import os
-import typing
+from .._bootstrap import ensure_pygame
+
+ensure_pygame()
 
 import pygame
 
@@ -124,7 +125,7 @@ import pygame
 if pygame.version.vernum < (2, 1):
     raise ImportError(f"Your pygame version is too old: {pygame.version.ver!r} < '2.1.0'", name=__name__, path=__file__)
 
-SDL_IMAGE_VERSION = typing.cast(tuple[int, int, int], pygame.image.get_sdl_image_version())
+SDL_IMAGE_VERSION: tuple[int, int, int] | None = pygame.image.get_sdl_image_version()
 
 if SDL_IMAGE_VERSION is None:
     raise ImportError("SDL_image library is not loaded", name=__name__, path=__file__)
@@ -138,29 +139,164 @@ if SDL_IMAGE_VERSION < (2, 0, 0):
 
 
 ############ Cleanup ############
-del os, typing, pygame
+del pygame, ensure_pygame
 
 
 ############ Package initialization ############
-from .animation import *
-from .button import *
-from .checkbox import *
-from .color import *
-from .drawable import *
-from .entry import *
-from .font import *
-from .form import *
-from .gradients import *
-from .grid import *
-from .image import *
-from .movable import *
-from .progress import *
-from .rect import *
-from .renderer import *
-from .scale import *
-from .scroll import *
-from .shape import *
-from .sprite import *
-from .surface import *
-from .text import *
-from .transformable import *
+# The submodules are only imported when one of their names is accessed (PEP 562)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .animation import *
+    from .button import *
+    from .checkbox import *
+    from .color import *
+    from .drawable import *
+    from .entry import *
+    from .font import *
+    from .form import *
+    from .gradients import *
+    from .grid import *
+    from .image import *
+    from .movable import *
+    from .progress import *
+    from .rect import *
+    from .renderer import *
+    from .scale import *
+    from .scroll import *
+    from .shape import *
+    from .sprite import *
+    from .surface import *
+    from .text import *
+    from .transformable import *
+
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "AbstractCircleShape": "shape",
+    "AbstractCrossShape": "shape",
+    "AbstractRectangleShape": "shape",
+    "AbstractRenderer": "renderer",
+    "AbstractShape": "shape",
+    "AnimatedSprite": "sprite",
+    "AnimationInterpolator": "animation",
+    "AnimationInterpolatorPool": "animation",
+    "BLACK": "color",
+    "BLUE": "color",
+    "BLUE_DARK": "color",
+    "BLUE_LIGHT": "color",
+    "BaseAnimation": "animation",
+    "BaseDrawableGroup": "drawable",
+    "BaseLayeredDrawableGroup": "drawable",
+    "BooleanCheckBox": "checkbox",
+    "Button": "button",
+    "ButtonMeta": "button",
+    "COLOR_DICT": "color",
+    "CYAN": "color",
+    "CheckBox": "checkbox",
+    "CheckBoxMeta": "checkbox",
+    "CircleShape": "shape",
+    "Color": "color",
+    "DiagonalCrossShape": "shape",
+    "Drawable": "drawable",
+    "DrawableGroup": "drawable",
+    "DrawableMeta": "drawable",
+    "Entry": "entry",
+    "EntryMeta": "entry",
+    "Font": "font",
+    "Form": "form",
+    "FormMeta": "form",
+    "GRAY": "color",
+    "GRAY_DARK": "color",
+    "GRAY_LIGHT": "color",
+    "GREEN": "color",
+    "GREEN_DARK": "color",
+    "GREEN_LIGHT": "color",
+    "GradientShape": "gradients",
+    "Grid": "grid",
+    "GridElement": "grid",
+    "HorizontalGradientShape": "gradients",
+    "HorizontalMultiColorShape": "gradients",
+    "Image": "image",
+    "ImageButton": "button",
+    "ImmutableColor": "color",
+    "ImmutableRect": "rect",
+    "LayeredDrawableGroup": "drawable",
+    "LayeredSpriteGroup": "sprite",
+    "MAGENTA": "color",
+    "MDrawable": "drawable",
+    "MDrawableMeta": "drawable",
+    "Mask": "sprite",
+    "Movable": "movable",
+    "MovableMeta": "movable",
+    "MovableProxy": "movable",
+    "MovableProxyMeta": "movable",
+    "MoveAnimation": "animation",
+    "MultiColorShape": "gradients",
+    "ORANGE": "color",
+    "OutlinedShape": "shape",
+    "PURPLE": "color",
+    "PlusCrossShape": "shape",
+    "PolygonShape": "shape",
+    "ProgressBar": "progress",
+    "ProgressBarMeta": "progress",
+    "RED": "color",
+    "RED_DARK": "color",
+    "RED_LIGHT": "color",
+    "RadialGradientShape": "gradients",
+    "Rect": "rect",
+    "RectangleShape": "shape",
+    "ScaleBar": "scale",
+    "ScrollArea": "scroll",
+    "ScrollAreaElement": "scroll",
+    "ScrollBar": "scroll",
+    "ScrollBarMeta": "scroll",
+    "ShapeMeta": "shape",
+    "SingleColorShape": "shape",
+    "Sprite": "sprite",
+    "SpriteGroup": "sprite",
+    "SquaredGradientShape": "gradients",
+    "SupportsDrawableGroups": "drawable",
+    "SupportsDrawing": "drawable",
+    "Surface": "surface",
+    "SurfaceRenderer": "surface",
+    "SysFont": "font",
+    "TDrawable": "drawable",
+    "TDrawableMeta": "drawable",
+    "TRANSPARENT": "color",
+    "Text": "text",
+    "TextImage": "text",
+    "TextMeta": "text",
+    "TransformAnimation": "animation",
+    "Transformable": "transformable",
+    "TransformableMeta": "transformable",
+    "TransformableProxy": "transformable",
+    "TransformableProxyMeta": "transformable",
+    "VerticalGradientShape": "gradients",
+    "VerticalMultiColorShape": "gradients",
+    "WHITE": "color",
+    "YELLOW": "color",
+    "create_surface": "surface",
+    "load_image": "surface",
+    "save_image": "surface",
+}
+
+
+def __getattr__(name: str) -> object:
+    from importlib import import_module
+
+    try:
+        submodule_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        if name not in _LAZY_ATTRIBUTES.values():
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+        return import_module(f".{name}", __name__)  # Submodule accessed as an attribute
+
+    obj: object = getattr(import_module(f".{submodule_name}", __name__), name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+del TYPE_CHECKING
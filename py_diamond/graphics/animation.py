@@ -9,8 +9,9 @@ from __future__ import annotations
 __all__ = ["AnimationInterpolator", "AnimationInterpolatorPool", "BaseAnimation", "MoveAnimation", "TransformAnimation"]
 
 from abc import ABCMeta, abstractmethod
-from contextlib import ExitStack, contextmanager
-from types import MappingProxyType
+from contextlib import contextmanager
+from dataclasses import dataclass
+from math import hypot
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -18,7 +19,7 @@ from typing import (
     Final,
     Iterator,
     Literal as L,
-    NamedTuple,
+    Mapping,
     Protocol,
     TypeAlias,
     TypeVar,
@@ -27,7 +28,7 @@ from typing import (
 )
 from weakref import WeakKeyDictionary, ref as weakref
 
-from ..math import Vector2, angle_interpolation, linear_interpolation
+from ..math import Vector2, angle_interpolation
 from ..system.object import Object, final
 from ..system.utils.weakref import weakref_unwrap
 from ..window.time import Time
@@ -69,9 +70,19 @@ class AnimationInterpolator(Object):
 
     @contextmanager
     def fixed_update(self) -> Iterator[None]:
-        if self.__state_update:
+        if not self._begin_fixed_update():
             yield
             return
+        save_state: bool = False
+        try:
+            yield
+            save_state = True
+        finally:
+            self._end_fixed_update(save_state=save_state)
+
+    def _begin_fixed_update(self) -> bool:
+        if self.__state_update:
+            return False
         self.__state_update = True
         try:
             obj: Movable | Transformable = weakref_unwrap(self.__obj)
@@ -81,9 +92,15 @@ class AnimationInterpolator(Object):
                 self.__actual_state = None
             else:
                 self.__previous_state = self.__state_factory.from_object(obj)
-            yield
-            if self.__previous_state is not None:  # reset() was not called
-                self.__actual_state = self.__state_factory.from_object(obj)
+        except BaseException:
+            self.__state_update = False
+            raise
+        return True
+
+    def _end_fixed_update(self, *, save_state: bool) -> None:
+        try:
+            if save_state and self.__previous_state is not None:  # reset() was not called
+                self.__actual_state = self.__state_factory.from_object(weakref_unwrap(self.__obj))
         finally:
             self.__state_update = False
 
@@ -92,11 +109,15 @@ class AnimationInterpolator(Object):
             raise RuntimeError(f"update() during state update")
         previous: _ObjectStateProtocol | None = self.__previous_state
         actual: _ObjectStateProtocol | None = self.__actual_state
-        if not previous or not actual:
+        if previous is None or actual is None or previous == actual:  # Nothing moved since the last fixed update
             return
-        interpolation = min(max(interpolation, 0), 1)
         obj: Movable | Transformable = weakref_unwrap(self.__obj)
-        previous.interpolate(actual, interpolation, obj)
+        if interpolation <= 0:
+            previous.apply_on(obj)
+        elif interpolation >= 1:
+            actual.apply_on(obj)
+        else:
+            previous.interpolate(actual, interpolation, obj)
 
     def reset(self) -> None:
         self.__actual_state = self.__previous_state = None
@@ -108,26 +129,41 @@ class AnimationInterpolator(Object):
 
 @final
 class AnimationInterpolatorPool(Object):
-    __slots__ = ("__interpolators",)
+    __slots__ = ("__interpolators", "__interpolators_snapshot")
 
     def __init__(self, *objects: Movable | Transformable) -> None:
         super().__init__()
         self.__interpolators: WeakKeyDictionary[Movable | Transformable, AnimationInterpolator] = WeakKeyDictionary()
+        self.__interpolators_snapshot: tuple[AnimationInterpolator, ...] = ()
         self.add(*objects)
 
     @contextmanager
     def fixed_update(self) -> Iterator[None]:
-        with ExitStack() as stack:
-            for interpolator in self.__interpolators.values():
-                stack.enter_context(interpolator.fixed_update())
+        started: list[AnimationInterpolator] = []
+        save_state: bool = False
+        try:
+            for interpolator in self.__get_interpolators():
+                if interpolator._begin_fixed_update():
+                    started.append(interpolator)
             yield
+            save_state = True
+        finally:
+            # TODO (3.11): Exception groups
+            error: BaseException | None = None
+            for interpolator in reversed(started):
+                try:
+                    interpolator._end_fixed_update(save_state=save_state and error is None)
+                except BaseException as exc:
+                    error = exc
+            if error is not None:
+                raise error
 
     def update(self, interpolation: float) -> None:
-        for interpolator in self.__interpolators.values():
+        for interpolator in self.__get_interpolators():
             interpolator.update(interpolation)
 
     def reset_all(self) -> None:
-        for interpolator in self.__interpolators.values():
+        for interpolator in self.__get_interpolators():
             interpolator.reset()
 
     def add(self, *objects: Movable | Transformable) -> None:
@@ -135,10 +171,20 @@ class AnimationInterpolatorPool(Object):
             return
         interpolators = (AnimationInterpolator(obj) for obj in objects)
         self.__interpolators.update({interpolator.object: interpolator for interpolator in interpolators})
+        self.__interpolators_snapshot = tuple(self.__interpolators.values())
 
     def remove(self, obj: Movable | Transformable) -> None:
         obj = AnimationInterpolator(obj).object
         del self.__interpolators[obj]
+        self.__interpolators_snapshot = tuple(self.__interpolators.values())
+
+    def __get_interpolators(self) -> tuple[AnimationInterpolator, ...]:
+        # Iterating over a WeakKeyDictionary is costly: use a snapshot taken at each add()/remove() call,
+        # which only needs to be refreshed when an object has been garbage collected in the meantime.
+        snapshot = self.__interpolators_snapshot
+        if len(snapshot) != len(self.__interpolators):
+            self.__interpolators_snapshot = snapshot = tuple(self.__interpolators.values())
+        return snapshot
 
 
 class BaseAnimation(Object):
@@ -305,7 +351,7 @@ _AnimationType: TypeAlias = L["move", "rotate", "rotate_point", "scale"]
 @final
 class TransformAnimation(BaseAnimation):
 
-    __slots__ = ("__animations",)
+    __slots__ = ("__animations", "__ordered_animations", "__any_started")
 
     __animations_order: Final[tuple[_AnimationType, ...]] = ("scale", "rotate", "rotate_point", "move")
 
@@ -313,6 +359,8 @@ class TransformAnimation(BaseAnimation):
         assert isinstance(transformable, Transformable), "Expected a Transformable object"
         super().__init__(transformable)
         self.__animations: dict[_AnimationType, _AbstractAnimationClass] = {}
+        self.__ordered_animations: tuple[_AbstractAnimationClass, ...] = ()
+        self.__any_started: bool | None = None  # Cached has_animation_started() result
 
     if TYPE_CHECKING:
         __Self = TypeVar("__Self", bound="TransformAnimation")
@@ -356,17 +404,17 @@ class TransformAnimation(BaseAnimation):
 
     def smooth_set_position(self: __Self, speed: float = 100, **position: float | tuple[float, float]) -> __Self:
         transformable: Transformable = self.object
-        self.__animations["move"] = _AnimationSetPosition(transformable, speed, position)
+        self.__set_animation("move", _AnimationSetPosition(transformable, speed, position))
         return self
 
     def smooth_translation(self: __Self, translation: Vector2 | tuple[float, float], speed: float = 100) -> __Self:
         transformable: Transformable = self.object
-        self.__animations["move"] = _AnimationMove(transformable, speed, translation)
+        self.__set_animation("move", _AnimationMove(transformable, speed, translation))
         return self
 
     def infinite_translation(self: __Self, direction: Vector2 | tuple[float, float], speed: float = 100) -> __Self:
         transformable: Transformable = self.object
-        self.__animations["move"] = _AnimationInfiniteMove(transformable, speed, direction)
+        self.__set_animation("move", _AnimationInfiniteMove(transformable, speed, direction))
         return self
 
     def smooth_set_angle(
@@ -380,7 +428,7 @@ class TransformAnimation(BaseAnimation):
         transformable: Transformable = self.object
         if pivot is not None:
             self.__animations.pop("rotate_point", None)
-        self.__animations["rotate"] = _AnimationSetRotation(transformable, angle, speed, pivot, counter_clockwise)
+        self.__set_animation("rotate", _AnimationSetRotation(transformable, angle, speed, pivot, counter_clockwise))
         return self
 
     def smooth_rotation(
@@ -389,7 +437,7 @@ class TransformAnimation(BaseAnimation):
         speed: float = 100,
     ) -> __Self:
         transformable: Transformable = self.object
-        self.__animations["rotate"] = _AnimationRotation(transformable, angle, speed)
+        self.__set_animation("rotate", _AnimationRotation(transformable, angle, speed))
         return self
 
     def smooth_rotation_around_point(
@@ -403,12 +451,12 @@ class TransformAnimation(BaseAnimation):
         transformable: Transformable = self.object
         if rotate_object:
             self.__animations.pop("rotate", None)
-        self.__animations["rotate_point"] = _AnimationRotationAroundPoint(transformable, angle, speed, pivot, rotate_object)
+        self.__set_animation("rotate_point", _AnimationRotationAroundPoint(transformable, angle, speed, pivot, rotate_object))
         return self
 
     def infinite_rotation(self: __Self, speed: float = 100, *, counter_clockwise: bool = True) -> __Self:
         transformable: Transformable = self.object
-        self.__animations["rotate"] = _AnimationInfiniteRotate(transformable, speed, counter_clockwise)
+        self.__set_animation("rotate", _AnimationInfiniteRotate(transformable, speed, counter_clockwise))
         return self
 
     def infinite_rotation_around_point(
@@ -422,44 +470,60 @@ class TransformAnimation(BaseAnimation):
         transformable: Transformable = self.object
         if rotate_object:
             self.__animations.pop("rotate", None)
-        self.__animations["rotate_point"] = _AnimationInfiniteRotateAroundPoint(
-            transformable, speed, pivot, counter_clockwise, rotate_object
+        self.__set_animation(
+            "rotate_point",
+            _AnimationInfiniteRotateAroundPoint(transformable, speed, pivot, counter_clockwise, rotate_object),
         )
         return self
 
     def smooth_scale_to_width(self: __Self, width: float, speed: float = 100) -> __Self:
         transformable: Transformable = self.object
-        self.__animations["scale"] = _AnimationSetSize(transformable, width, speed, "width")
+        self.__set_animation("scale", _AnimationSetSize(transformable, width, speed, "width"))
         return self
 
     def smooth_scale_to_height(self: __Self, height: float, speed: float = 100) -> __Self:
         transformable: Transformable = self.object
-        self.__animations["scale"] = _AnimationSetSize(transformable, height, speed, "height")
+        self.__set_animation("scale", _AnimationSetSize(transformable, height, speed, "height"))
         return self
 
     def smooth_width_growth(self: __Self, width_offset: float, speed: float = 100) -> __Self:
         transformable: Transformable = self.object
-        self.__animations["scale"] = _AnimationSizeGrowth(transformable, width_offset, speed, "width")
+        self.__set_animation("scale", _AnimationSizeGrowth(transformable, width_offset, speed, "width"))
         return self
 
     def smooth_height_growth(self: __Self, height_offset: float, speed: float = 100) -> __Self:
         transformable: Transformable = self.object
-        self.__animations["scale"] = _AnimationSizeGrowth(transformable, height_offset, speed, "height")
+        self.__set_animation("scale", _AnimationSizeGrowth(transformable, height_offset, speed, "height"))
         return self
 
     def has_animation_started(self) -> bool:
-        return any(animation.started() for animation in self.__animations.values())
+        # The animations can only stop during a fixed update, so the result is kept until the next one
+        any_started = self.__any_started
+        if any_started is None:
+            self.__any_started = any_started = any(animation.started() for animation in self.__ordered_animations)
+        return any_started
 
     def clear(self, *, pause: bool = False) -> None:
         super().clear(pause=pause)
         self.__animations.clear()
+        self.__ordered_animations = ()
+        self.__any_started = None
 
     def _launch_animations(self) -> None:
-        for animation in filter(None, map(self.__animations.get, self.__animations_order)):
-            if animation.started():
-                animation.fixed_update()
-            else:
-                animation.default()
+        try:
+            for animation in self.__ordered_animations:
+                if animation.started():
+                    animation.fixed_update()
+                else:
+                    animation.default()
+        finally:
+            self.__any_started = None
+
+    def __set_animation(self, animation_type: _AnimationType, animation: _AbstractAnimationClass) -> None:
+        animations = self.__animations
+        animations[animation_type] = animation
+        self.__ordered_animations = tuple(animations[t] for t in self.__animations_order if t in animations)
+        self.__any_started = None
 
 
 class _ObjectStateProtocol(Protocol):
@@ -478,53 +542,50 @@ class _ObjectStateProtocol(Protocol):
 
 
 @final
-class _MoveState(NamedTuple):
-    center: Vector2
+@dataclass(slots=True)
+class _MoveState:
+    center: tuple[float, float]
 
     @staticmethod
     def from_object(m: Movable) -> _MoveState:
-        return _MoveState(Vector2(m.center))
+        return _MoveState(m.center)
 
     def interpolate(self, other: _MoveState, alpha: float, m: Movable) -> None:
-        center = self.center.lerp(other.center, alpha)
-        m.center = (center.x, center.y)
+        (start_x, start_y), (end_x, end_y) = self.center, other.center
+        m.center = (start_x + (end_x - start_x) * alpha, start_y + (end_y - start_y) * alpha)
 
     def apply_on(self, m: Movable) -> None:
-        center = self.center
-        m.center = (center.x, center.y)
+        m.center = self.center
 
 
 @final
-class _TransformState(NamedTuple):
+@dataclass(slots=True)
+class _TransformState:
     angle: float
     scale: tuple[float, float]
-    center: Vector2
-    data: MappingProxyType[str, Any] | None
+    center: tuple[float, float]
+    data: Mapping[str, Any] | None
 
     @staticmethod
     def from_object(t: Transformable) -> _TransformState:
-        data: MappingProxyType[str, Any] | None = None
-        state = t._freeze_state()
-        if state is not None:
-            data = MappingProxyType(state)
-        return _TransformState(t.angle, t.scale, Vector2(t.center), data)
+        # _freeze_state() returns a new dict each time, which is only read by _set_frozen_state(): no need to wrap it
+        return _TransformState(t.angle, t.scale, t.center, t._freeze_state())
 
     def interpolate(self, other: _TransformState, alpha: float, t: Transformable) -> None:
+        # Linear interpolations are inlined (this is called at each frame for each animated object)
+        # 'start + (end - start) * alpha' gives back exactly 'start' if both values are equal
         angle = angle_interpolation(self.angle, other.angle, alpha)
-        scale = (
-            linear_interpolation(self.scale[0], other.scale[0], alpha),
-            linear_interpolation(self.scale[1], other.scale[1], alpha),
-        )
-        center = self.center.lerp(other.center, alpha)
+        (start_scale_x, start_scale_y), (end_scale_x, end_scale_y) = self.scale, other.scale
+        scale = (start_scale_x + (end_scale_x - start_scale_x) * alpha, start_scale_y + (end_scale_y - start_scale_y) * alpha)
+        (start_x, start_y), (end_x, end_y) = self.center, other.center
         if not t._set_frozen_state(angle, scale, None):
             t.apply_rotation_scale()
-        t.center = (center.x, center.y)
+        t.center = (start_x + (end_x - start_x) * alpha, start_y + (end_y - start_y) * alpha)
 
     def apply_on(self, t: Transformable) -> None:
         if not t._set_frozen_state(self.angle, self.scale, self.data):
             t.apply_rotation_scale()
-        center = self.center
-        t.center = (center.x, center.y)
+        t.center = self.center
 
 
 class _AbstractAnimationClass(metaclass=ABCMeta):
@@ -533,14 +594,12 @@ class _AbstractAnimationClass(metaclass=ABCMeta):
         "__object",
         "__animation_started",
         "__speed",
-        "__delta",
     )
 
     def __init__(self, obj: Movable, speed: float) -> None:
         self.__object: Movable = obj
         self.__animation_started: bool = True
         self.__speed: float = speed
-        self.__delta: Callable[[], float] = Time.fixed_delta
 
     def started(self) -> bool:
         return self.__animation_started and self.__speed > 0
@@ -564,7 +623,7 @@ class _AbstractAnimationClass(metaclass=ABCMeta):
 
     @property
     def speed(self) -> float:
-        return self.__speed * self.__delta()
+        return self.__speed * Time.fixed_delta()
 
 
 class _AbstractTransformableAnimationClass(_AbstractAnimationClass):
@@ -592,14 +651,15 @@ class _AnimationSetPosition(_AbstractAnimationClass):
 
     def fixed_update(self) -> None:
         movable: Movable = self.object
-        actual_position = Vector2(movable.center)
-        projection = movable.get_rect(**self.__position)
-        direction = Vector2(projection.center) - actual_position
-        speed = self.speed
-        length = direction.length()
+        actual_x, actual_y = movable.center
+        projection_x, projection_y = movable.get_rect(**self.__position).center
+        dx: float = projection_x - actual_x
+        dy: float = projection_y - actual_y
+        speed: float = self.speed
+        length: float = hypot(dx, dy)
         if length > 0 and length > speed:
-            direction.scale_to_length(speed)
-            movable.translate(direction)
+            ratio: float = speed / length
+            movable.translate((dx * ratio, dy * ratio))
         else:
             self.stop()
 
@@ -611,58 +671,60 @@ class _AnimationSetPosition(_AbstractAnimationClass):
 
 class _AnimationMove(_AbstractAnimationClass):
 
-    __slots__ = ("__vector", "__traveled")
+    __slots__ = ("__direction", "__length", "__traveled")
 
     def __init__(self, movable: Movable, speed: float, translation: Vector2 | tuple[float, float]) -> None:
         super().__init__(movable, speed)
-        self.__vector: Vector2 = Vector2(translation)
+        vector = Vector2(translation)
+        self.__length: float = vector.length()
+        if self.__length > 0:
+            vector.normalize_ip()
+        self.__direction: tuple[float, float] = (vector.x, vector.y)
         self.__traveled: float = 0
 
     def started(self) -> bool:
-        return super().started() and self.__vector.length_squared() > 0
+        return super().started() and self.__length > 0
 
     def fixed_update(self) -> None:
         movable: Movable = self.object
-        direction = self.__vector.xy
-        length: float = direction.length()
         speed: float = self.speed
         traveled: float = self.__traveled
-        offset: float = min(length - traveled, speed)
+        offset: float = min(self.__length - traveled, speed)
         if offset == 0:
             return self.stop()
-        direction.scale_to_length(offset)
-        movable.translate(direction)
+        direction_x, direction_y = self.__direction
+        movable.translate((direction_x * offset, direction_y * offset))
         self.__traveled += offset
 
     def default(self) -> None:
-        length: float = self.__vector.length()
+        length: float = self.__length
         if length:
             self.__traveled = length
-            self.__vector = Vector2(0, 0)
+            self.__length = 0
 
 
 class _AnimationInfiniteMove(_AbstractAnimationClass):
 
-    __slots__ = ("__vector",)
+    __slots__ = ("__direction",)
 
     def __init__(self, movable: Movable, speed: float, direction: Vector2 | tuple[float, float]) -> None:
         super().__init__(movable, speed)
-        self.__vector: Vector2 = Vector2(direction)
-        if self.__vector.length_squared() > 0:
-            self.__vector.normalize_ip()
+        vector = Vector2(direction)
+        if vector.length_squared() > 0:
+            vector.normalize_ip()
+        self.__direction: tuple[float, float] = (vector.x, vector.y)
 
     def started(self) -> bool:
-        return super().started() and self.__vector.length_squared() > 0
+        return super().started() and self.__direction != (0, 0)
 
     def fixed_update(self) -> None:
         movable: Movable = self.object
-        direction = self.__vector.xy
-        speed = self.speed
-        direction.scale_to_length(speed)
-        movable.translate(direction)
+        direction_x, direction_y = self.__direction  # Already normalized
+        speed: float = self.speed
+        movable.translate((direction_x * speed, direction_y * speed))
 
     def default(self) -> None:
-        self.__vector = Vector2(0, 0)
+        self.__direction = (0, 0)
 
 
 class _AnimationSetRotation(_AbstractTransformableAnimationClass):
@@ -680,10 +742,10 @@ class _AnimationSetRotation(_AbstractTransformableAnimationClass):
         super().__init__(transformable, speed)
         angle %= 360
         self.__angle: float = angle
-        self.__pivot: Vector2 | None
+        self.__pivot: tuple[float, float] | None
         if isinstance(pivot, str):
             pivot = transformable.get_pivot_from_attribute(pivot)
-        self.__pivot = Vector2(pivot) if pivot is not None else None
+        self.__pivot = (float(pivot[0]), float(pivot[1])) if pivot is not None else None
         self.__counter_clockwise: bool = counter_clockwise
 
     def fixed_update(self) -> None:
@@ -711,7 +773,7 @@ class _AnimationSetRotation(_AbstractTransformableAnimationClass):
 
 class _AnimationRotation(_AbstractTransformableAnimationClass):
 
-    __slots__ = ("__angle", "__orientation", "__actual_angle")
+    __slots__ = ("__angle", "__remaining")
 
     def __init__(
         self,
@@ -720,27 +782,29 @@ class _AnimationRotation(_AbstractTransformableAnimationClass):
         speed: float,
     ) -> None:
         super().__init__(transformable, speed)
-        self.__angle: float = abs(angle)
-        self.__orientation: int = int(angle // abs(angle)) if angle != 0 and speed > 0 else 0
-        self.__actual_angle: float = 0
+        self.__angle: float = angle
+        self.__remaining: float = angle  # Signed: the sign gives the orientation
 
     def started(self) -> bool:
         return super().started() and self.__angle != 0
 
     def fixed_update(self) -> None:
         transformable: Transformable = self.object
-        actual_angle: float = self.__actual_angle
-        angle: float = self.__angle
+        remaining: float = self.__remaining
         speed: float = self.speed
-        offset: float = min(angle - actual_angle, speed) * self.__orientation
+        offset: float = remaining
+        if offset > speed:
+            offset = speed
+        elif offset < -speed:
+            offset = -speed
         if offset == 0:
             return self.stop()
         transformable.rotate(offset)
-        self.__actual_angle += abs(offset)
+        self.__remaining = remaining - offset
 
     def default(self) -> None:
         if self.__angle:
-            self.__actual_angle = self.__angle
+            self.__remaining = 0
             self.__angle = 0
 
 
@@ -770,8 +834,7 @@ class _AnimationRotationAroundPoint(_AbstractTransformableAnimationClass):
 
     __slots__ = (
         "__angle",
-        "__orientation",
-        "__actual_angle",
+        "__remaining",
         "__pivot",
         "__rotate_object",
     )
@@ -785,13 +848,12 @@ class _AnimationRotationAroundPoint(_AbstractTransformableAnimationClass):
         rotate_object: bool,
     ) -> None:
         super().__init__(transformable, speed)
-        self.__angle: float = abs(angle)
-        self.__orientation: int = int(angle // abs(angle)) if angle != 0 and speed > 0 else 0
-        self.__actual_angle: float = 0
-        self.__pivot: Vector2
+        self.__angle: float = angle
+        self.__remaining: float = angle  # Signed: the sign gives the orientation
+        self.__pivot: tuple[float, float]
         if isinstance(pivot, str):
             pivot = transformable.get_pivot_from_attribute(pivot)
-        self.__pivot = Vector2(pivot)
+        self.__pivot = (float(pivot[0]), float(pivot[1]))
         self.__rotate_object: bool = rotate_object
 
     def started(self) -> bool:
@@ -799,21 +861,24 @@ class _AnimationRotationAroundPoint(_AbstractTransformableAnimationClass):
 
     def fixed_update(self) -> None:
         transformable: Transformable = self.object
-        actual_angle: float = self.__actual_angle
-        angle: float = self.__angle
+        remaining: float = self.__remaining
         speed: float = self.speed
-        offset: float = min(angle - actual_angle, speed) * self.__orientation
+        offset: float = remaining
+        if offset > speed:
+            offset = speed
+        elif offset < -speed:
+            offset = -speed
         if offset == 0:
             return self.stop()
         if self.__rotate_object:
             transformable.rotate(offset, self.__pivot)
         else:
             transformable.rotate_around_point(offset, self.__pivot)
-        self.__actual_angle += abs(offset)
+        self.__remaining = remaining - offset
 
     def default(self) -> None:
         if self.__angle:
-            self.__actual_angle = self.__angle
+            self.__remaining = 0
             self.__angle = 0
 
 
@@ -830,10 +895,10 @@ class _AnimationInfiniteRotateAroundPoint(_AbstractTransformableAnimationClass):
         rotate_object: bool,
     ) -> None:
         super().__init__(transformable, speed)
-        self.__pivot: Vector2
+        self.__pivot: tuple[float, float]
         if isinstance(pivot, str):
             pivot = transformable.get_pivot_from_attribute(pivot)
-        self.__pivot = Vector2(pivot)
+        self.__pivot = (float(pivot[0]), float(pivot[1]))
         self.__orientation: int = 1 if counter_clockwise else -1
         self.__rotate_object: bool = rotate_object
 
@@ -851,22 +916,21 @@ class _AnimationInfiniteRotateAroundPoint(_AbstractTransformableAnimationClass):
 
 class _AbstractAnimationScale(_AbstractTransformableAnimationClass):
 
-    __slots__ = ("__field",)
+    __slots__ = ("__size_index", "__scale_to_size")
 
     def __init__(self, transformable: Transformable, speed: float, field: L["width", "height"]) -> None:
         super().__init__(transformable, speed)
         if field not in ("width", "height"):
             raise ValueError("Invalid arguments")
-        self.__field: L["width", "height"] = field
+        # Resolved once: these are used at each fixed update
+        self.__size_index: int = 0 if field == "width" else 1
+        self.__scale_to_size: Callable[[float], None] = getattr(transformable, f"scale_to_{field}")
 
     def get_transformable_size(self) -> float:
-        area: tuple[float, float] = self.object.get_area_size(apply_rotation=False)
-        if self.__field == "width":
-            return area[0]
-        return area[1]
+        return self.object.get_area_size(apply_rotation=False)[self.__size_index]
 
     def set_transformable_size(self, value: float) -> None:
-        getattr(self.object, f"scale_to_{self.__field}")(value)
+        self.__scale_to_size(value)
 
 
 class _AnimationSetSize(_AbstractAnimationScale):
@@ -880,16 +944,11 @@ class _AnimationSetSize(_AbstractAnimationScale):
     def fixed_update(self) -> None:
         speed: float = self.speed
         actual_size: float = self.get_transformable_size()
-        requested_size: float = self.__value
-        offset: float = speed
-        remaining: float
-        if actual_size > requested_size:
-            offset = -offset
-            remaining = actual_size - requested_size
-        else:
-            remaining = requested_size - actual_size
+        remaining: float = self.__value - actual_size  # Signed: the sign gives the orientation
         if remaining > speed:
-            self.set_transformable_size(actual_size + offset)
+            self.set_transformable_size(actual_size + speed)
+        elif remaining < -speed:
+            self.set_transformable_size(actual_size - speed)
         else:
             self.stop()
 
@@ -899,29 +958,31 @@ class _AnimationSetSize(_AbstractAnimationScale):
 
 class _AnimationSizeGrowth(_AbstractAnimationScale):
 
-    __slots__ = ("__value", "__orientation", "__actual_value")
+    __slots__ = ("__value", "__remaining")
 
     def __init__(self, transformable: Transformable, offset: float, speed: float, field: L["width", "height"]) -> None:
         super().__init__(transformable, speed, field)
-        self.__value: float = abs(offset)
-        self.__orientation: int = int(offset // abs(offset)) if offset != 0 and speed > 0 else 0
-        self.__actual_value: float = 0
+        self.__value: float = offset
+        self.__remaining: float = offset  # Signed: the sign gives the orientation
 
     def started(self) -> bool:
         return super().started() and self.__value != 0
 
     def fixed_update(self) -> None:
-        actual_value: float = self.__actual_value
-        value: float = self.__value
+        remaining: float = self.__remaining
         speed: float = self.speed
-        offset: float = min(value - actual_value, speed) * self.__orientation
+        offset: float = remaining
+        if offset > speed:
+            offset = speed
+        elif offset < -speed:
+            offset = -speed
         if offset == 0:
             return self.stop()
         actual_size: float = self.get_transformable_size()
         self.set_transformable_size(actual_size + offset)
-        self.__actual_value += abs(offset)
+        self.__remaining = remaining - offset
 
     def default(self) -> None:
         if self.__value:
-            self.__actual_value = self.__value
+            self.__remaining = 0
             self.__value = 0
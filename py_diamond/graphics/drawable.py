@@ -22,14 +22,15 @@ __all__ = [
 ]
 
 from abc import abstractmethod
-from bisect import insort_left, insort_right
+from bisect import bisect_left, bisect_right
 from collections import deque
 from contextlib import suppress
-from itertools import dropwhile, filterfalse, takewhile
+from itertools import filterfalse, islice
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Final,
     Iterator,
     MutableSequence,
     Protocol,
@@ -41,7 +42,7 @@ from typing import (
 from weakref import WeakKeyDictionary, WeakSet
 
 from ..system.object import Object, ObjectMeta, final
-from ..system.utils._mangling import getattr_pv
+from ..system.utils._mangling import mangle_private_attribute
 from ..system.utils.abc import isabstractmethod
 from ..system.utils.functools import wraps
 from .movable import Movable, MovableMeta
@@ -202,11 +203,12 @@ _D = TypeVar("_D", bound=SupportsDrawableGroups)
 
 class BaseDrawableGroup(Sequence[_D]):
 
-    __slots__ = ("__list", "__weakref__")
+    __slots__ = ("__list", "__set", "__weakref__")
 
     def __init__(self, *objects: _D, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self.__list: MutableSequence[_D] = deque()
+        self.__set: set[_D] = set()  # Membership sidecar of self.__list, in order to avoid linear lookups
         self.add(*objects)
 
     def __iter__(self) -> Iterator[_D]:
@@ -215,6 +217,12 @@ class BaseDrawableGroup(Sequence[_D]):
     def __len__(self) -> int:
         return self.__list.__len__()
 
+    def __contains__(self, value: object, /) -> bool:
+        try:
+            return value in self.__set
+        except TypeError:  # Unhashable object
+            return False
+
     @overload
     def __getitem__(self, index: int, /) -> _D:
         ...
@@ -235,92 +243,133 @@ class BaseDrawableGroup(Sequence[_D]):
 
     def add(self, *objects: _D) -> None:
         drawable_list: MutableSequence[_D] = self.__list
-        for d in filterfalse(drawable_list.__contains__, objects):
+        drawable_set: set[_D] = self.__set
+        for d in filterfalse(drawable_set.__contains__, objects):
             drawable_list.append(d)
-            if self not in d.groups:
-                try:
-                    d.add_to_group(self)
-                except:
-                    drawable_list.remove(d)
-                    raise
+            drawable_set.add(d)
+            try:
+                d.add_to_group(self)  # No-op if 'self' is already registered
+            except:
+                drawable_list.remove(d)
+                drawable_set.discard(d)
+                raise
 
     def remove(self, *objects: _D) -> None:
         if not objects:
             return
-        drawable_list: MutableSequence[_D] = self.__list
+        drawable_set: set[_D] = self.__set
         for d in objects:
-            if d not in drawable_list:
+            if d not in drawable_set:
                 raise ValueError(f"{d!r} not in self")
+        if len(objects) == 1:
+            self.__list.remove(objects[0])
+        else:
+            # Rebuild the list in one pass instead of doing a linear search for each object
+            removed: frozenset[_D] = frozenset(objects)
+            self.__list = deque(filterfalse(removed.__contains__, self.__list))
+        drawable_set.difference_update(objects)
         for d in objects:
-            drawable_list.remove(d)
-            if self in d.groups:
-                with suppress(ValueError):
-                    d.remove_from_group(self)
+            with suppress(ValueError):  # Raised if 'self' is already unregistered
+                d.remove_from_group(self)
 
     def pop(self, index: int = -1) -> _D:
         assert isinstance(index, int)
         drawable_list: MutableSequence[_D] = self.__list
         d: _D = drawable_list[index]  # deque.pop() does not accept argument
         del drawable_list[index]
-        if self in d.groups:
-            with suppress(ValueError):
-                d.remove_from_group(self)
+        self.__set.discard(d)
+        with suppress(ValueError):  # Raised if 'self' is already unregistered
+            d.remove_from_group(self)
         return d
 
     def clear(self) -> None:
         drawable_list: MutableSequence[_D] = self.__list
         self.__list = deque()
+        self.__set = set()
         for d in drawable_list:
-            if self in d.groups:
-                with suppress(ValueError):
-                    d.remove_from_group(self)
+            with suppress(ValueError):  # Raised if 'self' is already unregistered
+                d.remove_from_group(self)
 
     def find(self, objtype: type[_T]) -> Iterator[_T]:
         return (obj for obj in self if isinstance(obj, objtype))
 
 
+# BaseDrawableGroup private attributes accessed by subclasses, mangled once
+_GROUP_LIST_ATTRIBUTE: Final[str] = mangle_private_attribute(BaseDrawableGroup, "list")
+_GROUP_SET_ATTRIBUTE: Final[str] = mangle_private_attribute(BaseDrawableGroup, "set")
+
+
 class DrawableGroup(BaseDrawableGroup[Drawable], Drawable):
     __slots__ = ()
 
 
 class BaseLayeredDrawableGroup(BaseDrawableGroup[_D]):
 
-    __slots__ = ("__default_layer", "__layer_dict")
+    __slots__ = ("__default_layer", "__layer_dict", "__layers")
 
     def __init__(self, *objects: _D, default_layer: int = 0, **kwargs: Any) -> None:
         self.__default_layer: int = default_layer
         self.__layer_dict: WeakKeyDictionary[_D, int] = WeakKeyDictionary()
+        self.__layers: list[int] = []  # Layer of each drawable, kept sorted in the same order than the drawable list
         super().__init__(*objects, **kwargs)
 
     def add(self, *objects: _D, layer: int | None = None) -> None:
         if not objects:
             return
         layer_dict: WeakKeyDictionary[_D, int] = self.__layer_dict
-        drawable_list: MutableSequence[_D] = getattr_pv(self, "list", owner=BaseDrawableGroup)
+        layers: list[int] = self.__layers
+        drawable_list: MutableSequence[_D] = getattr(self, _GROUP_LIST_ATTRIBUTE)
+        drawable_set: set[_D] = getattr(self, _GROUP_SET_ATTRIBUTE)
         if layer is None:
             layer = self.__default_layer
-        for d in filterfalse(drawable_list.__contains__, objects):
-            layer_dict.setdefault(d, layer)
-            insort_right(drawable_list, d, key=layer_dict.__getitem__)
-            if self not in d.groups:
-                try:
-                    d.add_to_group(self)
-                except:
-                    drawable_list.remove(d)
-                    raise
+        for d in filterfalse(drawable_set.__contains__, objects):
+            d_layer: int = layer_dict.setdefault(d, layer)
+            index: int = bisect_right(layers, d_layer)
+            layers.insert(index, d_layer)
+            drawable_list.insert(index, d)
+            drawable_set.add(d)
+            try:
+                d.add_to_group(self)  # No-op if 'self' is already registered
+            except:
+                del drawable_list[index]
+                del layers[index]
+                drawable_set.discard(d)
+                raise
 
     def remove(self, *objects: _D) -> None:
-        super().remove(*objects)
+        if not objects:
+            return
+        layer_dict: WeakKeyDictionary[_D, int] = self.__layer_dict
+        drawable_list: MutableSequence[_D] = getattr(self, _GROUP_LIST_ATTRIBUTE)
+        drawable_set: set[_D] = getattr(self, _GROUP_SET_ATTRIBUTE)
+        for d in objects:
+            if d not in drawable_set:
+                raise ValueError(f"{d!r} not in self")
+        if len(objects) == 1:
+            index: int = self.__index(objects[0], layer_dict[objects[0]])
+            del drawable_list[index]
+            del self.__layers[index]
+        else:
+            # Rebuild the lists in one pass instead of searching each object
+            removed: frozenset[_D] = frozenset(objects)
+            kept: list[tuple[_D, int]] = [(d, layer) for d, layer in zip(drawable_list, self.__layers) if d not in removed]
+            setattr(self, _GROUP_LIST_ATTRIBUTE, deque(d for d, _ in kept))
+            self.__layers = [layer for _, layer in kept]
+        drawable_set.difference_update(objects)
         for d in objects:
-            self.__layer_dict.pop(d, None)
+            layer_dict.pop(d, None)
+            with suppress(ValueError):  # Raised if 'self' is already unregistered
+                d.remove_from_group(self)
 
     def pop(self, index: int = -1) -> _D:
         d: _D = super().pop(index=index)
+        del self.__layers[index]
         self.__layer_dict.pop(d, None)
         return d
 
     def clear(self) -> None:
         super().clear()
+        self.__layers = []
         self.__layer_dict.clear()
 
     def get_layer(self, obj: _D) -> int:
@@ -336,20 +385,31 @@ class BaseLayeredDrawableGroup(BaseDrawableGroup[_D]):
         actual_layer: int | None = layer_dict.get(obj, None)
         if (actual_layer is None and layer == self.__default_layer) or (actual_layer is not None and actual_layer == layer):
             return
-        drawable_list: MutableSequence[_D] = getattr_pv(self, "list", owner=BaseDrawableGroup)
+        if actual_layer is None:
+            raise ValueError("obj not in group")
+        layers: list[int] = self.__layers
+        drawable_list: MutableSequence[_D] = getattr(self, _GROUP_LIST_ATTRIBUTE)
+        index: int = self.__index(obj, actual_layer)
+        del drawable_list[index]
+        del layers[index]
+        layer_dict[obj] = layer
+        index = bisect_right(layers, layer) if top_of_layer else bisect_left(layers, layer)
+        layers.insert(index, layer)
+        drawable_list.insert(index, obj)
+
+    def __index(self, obj: _D, layer: int) -> int:
+        layers: list[int] = self.__layers
+        drawable_list: MutableSequence[_D] = getattr(self, _GROUP_LIST_ATTRIBUTE)
         try:
-            drawable_list.remove(obj)
+            return drawable_list.index(obj, bisect_left(layers, layer), bisect_right(layers, layer))
         except ValueError:
             raise ValueError("obj not in group") from None
-        layer_dict[obj] = layer
-        insort = insort_right if top_of_layer else insort_left
-        insort(drawable_list, obj, key=layer_dict.__getitem__)
 
     def get_top_layer(self) -> int:
-        return self.__layer_dict[self[-1]]
+        return self.__layers[-1]
 
     def get_bottom_layer(self) -> int:
-        return self.__layer_dict[self[0]]
+        return self.__layers[0]
 
     def get_top_drawable(self) -> _D:
         return self[-1]
@@ -364,15 +424,9 @@ class BaseLayeredDrawableGroup(BaseDrawableGroup[_D]):
         self.change_layer(obj, self.get_bottom_layer() - int(bool(after_last)), top_of_layer=top_of_layer)
 
     def iter_in_layer(self, layer: int) -> Iterator[_D]:
-        layer_dict = self.__layer_dict
-        drawable_list: MutableSequence[_D] = getattr_pv(self, "list", owner=BaseDrawableGroup)
-        return takewhile(
-            lambda item: layer_dict[item] == layer,
-            dropwhile(
-                lambda item: layer_dict[item] < layer,
-                drawable_list,
-            ),
-        )
+        layers: list[int] = self.__layers
+        drawable_list: MutableSequence[_D] = getattr(self, _GROUP_LIST_ATTRIBUTE)
+        return islice(drawable_list, bisect_left(layers, layer), bisect_right(layers, layer))
 
     def get_from_layer(self, layer: int) -> Sequence[_D]:
         return list(self.iter_in_layer(layer))
@@ -395,7 +449,7 @@ class BaseLayeredDrawableGroup(BaseDrawableGroup[_D]):
 
     @property
     def layers(self) -> Sequence[int]:
-        return sorted(set(self.__layer_dict.values()) | {self.default_layer})
+        return sorted(set(self.__layers) | {self.default_layer})
 
 
 class LayeredDrawableGroup(BaseLayeredDrawableGroup[Drawable], Drawable):
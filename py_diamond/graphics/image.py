@@ -9,7 +9,7 @@ from __future__ import annotations
 __all__ = ["Image"]
 
 
-from typing import TYPE_CHECKING, Any, Mapping, overload
+from typing import TYPE_CHECKING, Any, Final, Mapping, overload
 
 from pygame.transform import rotozoom as _surface_rotozoom
 from typing_extensions import assert_never
@@ -30,8 +30,11 @@ class Image(TDrawable):
         "__default_image",
         "__image",
         "__smooth_scale",
+        "__transform_cache",
     )
 
+    __TRANSFORM_CACHE_SIZE: Final[int] = 4
+
     @overload
     def __init__(self) -> None:
         ...
@@ -70,6 +73,8 @@ class Image(TDrawable):
 
         self.__default_image = image
         self.__image = image
+        # Last transformed images, keyed by (angle, scale): back-and-forth transformations (e.g. hover effects) are common
+        self.__transform_cache: dict[tuple[float, tuple[float, float]], Surface] = {}
 
         match (width, height):
             case (int() | float() as width, int() | float() as height):
@@ -107,6 +112,7 @@ class Image(TDrawable):
             self.__default_image = create_surface((0, 0))
         else:
             self.__default_image = image.copy() if copy else image
+        self.__transform_cache.clear()
         self.apply_rotation_scale()
         self.center = center
 
@@ -114,11 +120,13 @@ class Image(TDrawable):
         mask = create_surface(self.__default_image.get_size() if rect is None else rect.size)
         mask.fill(color)
         self.__default_image.blit(mask, rect or (0, 0))
+        self.__transform_cache.clear()
         self.apply_rotation_scale()
 
     def load(self, file: str) -> None:
         center: tuple[float, float] = self.center
         self.__default_image = load_image(file)
+        self.__transform_cache.clear()
         self.apply_rotation_scale()
         self.center = center
 
@@ -132,13 +140,33 @@ class Image(TDrawable):
         return self.__image.get_size()
 
     def _apply_both_rotation_and_scale(self) -> None:
-        self.__image = _surface_rotozoom2(self.__default_image, self.angle, self.scale)
+        key: tuple[float, tuple[float, float]] = (self.angle, self.scale)
+        if key == (0, (1, 1)):  # Identity transformation: no need to copy the image
+            self.__image = self.__default_image
+            return
+        transform_cache = self.__transform_cache
+        try:
+            image: Surface = transform_cache.pop(key)
+        except KeyError:
+            image = _surface_rotozoom2(self.__default_image, *key)
+            if len(transform_cache) >= self.__TRANSFORM_CACHE_SIZE:
+                del transform_cache[next(iter(transform_cache))]
+        transform_cache[key] = image  # Keep the most recently used images at the end
+        self.__image = image
 
     def _apply_only_rotation(self) -> None:
-        self.__image = _surface_rotozoom(self.__default_image, self.angle, 1)
+        angle: float = self.angle
+        if angle == 0:
+            self.__image = self.__default_image
+            return
+        self.__image = _surface_rotozoom(self.__default_image, angle, 1)
 
     def _apply_only_scale(self) -> None:
-        self.__image = _surface_scale_by(self.__default_image, self.scale)
+        scale: tuple[float, float] = self.scale
+        if scale == (1, 1):
+            self.__image = self.__default_image
+            return
+        self.__image = _surface_scale_by(self.__default_image, scale)
 
     def _freeze_state(self) -> dict[str, Any] | None:
         state = super()._freeze_state()
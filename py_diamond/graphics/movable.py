@@ -67,9 +67,7 @@ class MovableMeta(ObjectMeta):
                     f"{name!r} must inherit from a {Movable.__name__} class in order to use {MovableMeta.__name__} metaclass"
                 )
 
-        for position in _ALL_VALID_POSITIONS:
-            if position not in namespace:
-                continue
+        for position in filter(namespace.__contains__, _ALL_VALID_POSITIONS):
             if any(hasattr(cls, position) for cls in bases):
                 raise TypeError("Override of position attributes is not allowed")
             prop: property = namespace[position]
@@ -117,9 +115,10 @@ class Movable(Object, metaclass=MovableMeta):
         ...
 
     def set_position(self, **position: float | tuple[float, float]) -> None:
-        assert all(name in _ALL_VALID_POSITIONS for name in position), f"Unknown position attribute caught"
+        position_setters = _POSITION_SETTERS
+        assert all(name in position_setters for name in position), f"Unknown position attribute caught"
         for name, value in position.items():
-            setattr(self, name, value)
+            position_setters[name](self, value)
 
     def move(self, dx: float, dy: float) -> None:
         if (dx, dy) == (0, 0):
@@ -310,6 +309,12 @@ class Movable(Object, metaclass=MovableMeta):
         self.__y = midright[1] - (h / 2)
 
 
+# Position properties cannot be overridden (see MovableMeta), so their setters can be called directly
+_POSITION_SETTERS: dict[str, Callable[[Movable, Any], None]] = {
+    position: getattr(Movable, position).fset for position in _ALL_VALID_POSITIONS
+}
+
+
 class MovableProxyMeta(MovableMeta):
     def __new__(mcs, name: str, bases: tuple[type, ...], namespace: dict[str, Any], **kwargs: Any) -> MovableMeta:
         if "MovableProxy" not in globals() and name == "MovableProxy":
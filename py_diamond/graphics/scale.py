@@ -29,6 +29,9 @@ if TYPE_CHECKING:
     from ..window.scene import Scene
     from .shape import AbstractRectangleShape
 
+# Key event classes are final, and isinstance() would go through the slow ABCMeta.__instancecheck__()
+_KEY_EVENT_TYPES: frozenset[type[Event]] = frozenset({KeyDownEvent, KeyUpEvent})
+
 
 class ScaleBar(ProgressBar, AbstractWidget):
     __theme_ignore__: ClassVar[Sequence[str]] = (
@@ -142,7 +145,7 @@ class ScaleBar(ProgressBar, AbstractWidget):
 
     def _should_ignore_event(self, event: Event) -> bool:
         return super()._should_ignore_event(event) or (
-            isinstance(event, (KeyDownEvent, KeyUpEvent)) and self._ignore_key_event(event)
+            type(event) in _KEY_EVENT_TYPES and self._ignore_key_event(event)  # type: ignore[arg-type]
         )
 
     def _ignore_key_event(self, event: KeyEvent) -> bool:
@@ -214,9 +217,11 @@ class ScaleBar(ProgressBar, AbstractWidget):
     def __apply_resolution_on_percent(self, percent: float) -> float:
         start: float = self.from_value
         end: float = self.to_value
-        value: float = round(start + (percent * (end - start)) if end > start else 0, self.resolution)
-        percent = (value - start) / (end - start) if end > start else 0
-        return percent
+        if end <= start:
+            return 0
+        span: float = end - start
+        value: float = round(start + (percent * span), self.resolution)
+        return (value - start) / span
 
     config.reset_getter_setter_deleter("outline")
     config.reset_getter_setter_deleter("outline_color")
@@ -266,17 +266,20 @@ class Text(TDrawable, metaclass=TextMeta):
 
         # 1- Retrieve all line rects
         line_top: int = 0
+        get_line_font = custom_font.get if custom_font else None
+        append_to_queue = render_queue.append
         for index, line in enumerate(text.splitlines()):
-            font = custom_font.get(index, default_font) if custom_font is not None else default_font
+            font = get_line_font(index, default_font) if get_line_font is not None else default_font
             line_rect = font.get_rect(line)
 
             line_rect.top = line_top
             line_top = line_rect.bottom + line_spacing
 
-            render_width = max(render_width, line_rect.width)
+            if line_rect.width > render_width:
+                render_width = line_rect.width
             render_height += line_rect.height + line_spacing
 
-            render_queue.append((line, font, line_rect))
+            append_to_queue((line, font, line_rect))
 
         # 2 - Compute the target surface
         if not render_queue:  # No message to render
@@ -291,7 +294,7 @@ class Text(TDrawable, metaclass=TextMeta):
         # 3- Apply 'justify' attribute to rects according to *default* render (w/o shadow)
         if len(render_queue) > 1 and justify_pos != "left":  # Ignore for 'left', it will always be 0
             justify_pos_value: int = getattr(render_rect, justify_pos)
-            for line_rect in map(lambda i: i[2], render_queue):
+            for _, _, line_rect in render_queue:
                 setattr(line_rect, justify_pos, justify_pos_value)
 
         # 4-a Render shadow if set
@@ -8,6 +8,13 @@ from __future__ import annotations
 
 __all__ = ["Vector2", "angle_interpolation", "linear_interpolation"]
 
+from .._bootstrap import ensure_pygame
+
+ensure_pygame()
+
+############ Cleanup ############
+del ensure_pygame
+
 
 ############ Package initialization ############
 from .interpolation import *
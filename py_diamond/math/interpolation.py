@@ -8,12 +8,14 @@ from __future__ import annotations
 
 __all__ = ["angle_interpolation", "linear_interpolation"]
 
+from math import remainder
+
 
 def angle_interpolation(start: float, end: float, alpha: float) -> float:
     if start == end:
         return start
     assert 0 <= alpha <= 1, "Invalid 'alpha' value range"
-    shortest_angle = ((end - start) + 180) % 360 - 180
+    shortest_angle = remainder(end - start, 360)  # IEEE remainder: signed delta within [-180, 180]
     return (start + shortest_angle * alpha) % 360
 
 
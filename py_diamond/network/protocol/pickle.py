@@ -18,6 +18,7 @@ __all__ = [
 from io import BytesIO
 from pickle import DEFAULT_PROTOCOL, STOP as STOP_OPCODE, Pickler, Unpickler, UnpicklingError
 from pickletools import optimize as pickletools_optimize
+from types import MethodType
 from typing import IO, TYPE_CHECKING, Any, Callable, Generator, Generic, TypeVar
 from weakref import ref as weakref
 
@@ -41,7 +42,10 @@ class PicklePacketSerializer(NetworkPacketIncrementalSerializer[_T_contra], Obje
     def serialize(self, packet: _T_contra) -> bytes:
         buffer = BytesIO()
         self.incremental_serialize_to(buffer, packet)
-        return pickletools_optimize(buffer.getvalue())
+        data: bytes = buffer.getvalue()
+        if self.use_pickle_optimizer():
+            data = pickletools_optimize(data)
+        return data
 
     @final
     def incremental_serialize(self, packet: _T_contra) -> Generator[bytes, None, None]:
@@ -56,6 +60,10 @@ class PicklePacketSerializer(NetworkPacketIncrementalSerializer[_T_contra], Obje
     def get_pickler(self, buffer: IO[bytes]) -> Pickler:
         return Pickler(buffer, protocol=DEFAULT_PROTOCOL, fix_imports=False, buffer_callback=None)
 
+    def use_pickle_optimizer(self) -> bool:
+        # pickletools.optimize() is a pure Python pass over every opcode, which usually costs more than the pickling itself
+        return False
+
 
 @concreteclass
 class PicklePacketDeserializer(NetworkPacketIncrementalDeserializer[_T_co], Object, metaclass=ProtocolObjectMeta):
@@ -69,26 +77,29 @@ class PicklePacketDeserializer(NetworkPacketIncrementalDeserializer[_T_co], Obje
             packet: _T_co = unpickler.load()
         except UnpicklingError as exc:
             raise ValidationError("Unpickling error") from exc
-        if buffer.read():  # There is still data after pickling
+        if buffer.tell() != len(data):  # There is still data after pickling
             raise ValidationError("Extra data caught")
         return packet
 
     @final
     def incremental_deserialize(self) -> Generator[None, bytes, tuple[_T_co, bytes]]:
-        data = BytesIO()
+        data = bytearray()
+        stop_opcode_search_start: int = 0
         while True:
-            data.write((yield))
-            if STOP_OPCODE not in data.getvalue():
+            data.extend((yield))
+            if data.find(STOP_OPCODE, stop_opcode_search_start) < 0:
+                stop_opcode_search_start = len(data)  # Do not scan the same bytes again with the next chunk
                 continue
-            data.seek(0)
-            unpickler = self.get_unpickler(data)
+            buffer = BytesIO(data)
+            unpickler = self.get_unpickler(buffer)
             try:
                 packet: _T_co = unpickler.load()
             except UnpicklingError:
                 # We flush unused data as it may be corrupted
-                data = BytesIO(data.getvalue().partition(STOP_OPCODE)[2])
+                del data[: data.index(STOP_OPCODE) + 1]
+                stop_opcode_search_start = 0
             else:
-                return (packet, data.read())
+                return (packet, bytes(data[buffer.tell() :]))
 
     def get_unpickler(self, buffer: IO[bytes]) -> Unpickler:
         return Unpickler(buffer, fix_imports=False, encoding="utf-8", errors="strict", buffers=None)
@@ -120,11 +131,10 @@ def _monkeypatch_protocol(self: _BaseGenericWrapper[Any], method_name: str) -> N
                 pass
 
     selfref: weakref[_BaseGenericWrapper[Any]] = weakref(self, unset_patch)
+    method: Callable[..., Any] = getattr(type(self), method_name)  # Resolved once instead of at each call
 
     def patch(*args: Any, **kwargs: Any) -> Any:
-        self: _BaseGenericWrapper[Any] = weakref_unwrap(selfref)
-        method: Callable[..., Any] = getattr(self, method_name)
-        return method(*args, **kwargs)
+        return method(weakref_unwrap(selfref), *args, **kwargs)
 
     setattr(self.protocol, method_name, patch)
 
@@ -134,21 +144,23 @@ def _monkeypatch_protocol(self: _BaseGenericWrapper[Any], method_name: str) -> N
 class SafePicklePacketSerializer(EncryptorPacketSerializer[_T_contra, PicklePacketSerializer[object]], Generic[_T_contra]):
     def __init__(self, key: str | bytes | Fernet | MultiFernet) -> None:
         super().__init__(PicklePacketSerializer(), key)
+        protocol = self.protocol
+        self.__protocol_get_pickler: Callable[[IO[bytes]], Pickler] = MethodType(type(protocol).get_pickler, protocol)
         _monkeypatch_protocol(self, "get_pickler")
 
     def get_pickler(self, buffer: IO[bytes]) -> Pickler:
-        protocol = self.protocol
-        return protocol.__class__.get_pickler(protocol, buffer)
+        return self.__protocol_get_pickler(buffer)
 
 
 class SafePicklePacketDeserializer(EncryptorPacketDeserializer[_T_co, PicklePacketDeserializer[object]], Generic[_T_co]):
     def __init__(self, key: str | bytes | Fernet | MultiFernet) -> None:
         super().__init__(PicklePacketDeserializer(), key)
+        protocol = self.protocol
+        self.__protocol_get_unpickler: Callable[[IO[bytes]], Unpickler] = MethodType(type(protocol).get_unpickler, protocol)
         _monkeypatch_protocol(self, "get_unpickler")
 
     def get_unpickler(self, buffer: IO[bytes]) -> Unpickler:
-        protocol = self.protocol
-        return protocol.__class__.get_unpickler(protocol, buffer)  # type: ignore[arg-type]
+        return self.__protocol_get_unpickler(buffer)
 
 
 class SafePickleNetworkProtocol(
@@ -157,13 +169,15 @@ class SafePickleNetworkProtocol(
 ):
     def __init__(self, key: str | bytes | Fernet | MultiFernet) -> None:
         super().__init__(PickleNetworkProtocol(), key)
+        protocol = self.protocol
+        # Bound to the class methods, as the instance ones are replaced by the patches below
+        self.__protocol_get_pickler: Callable[[IO[bytes]], Pickler] = MethodType(type(protocol).get_pickler, protocol)
+        self.__protocol_get_unpickler: Callable[[IO[bytes]], Unpickler] = MethodType(type(protocol).get_unpickler, protocol)
         _monkeypatch_protocol(self, "get_pickler")
         _monkeypatch_protocol(self, "get_unpickler")
 
     def get_pickler(self, buffer: IO[bytes]) -> Pickler:
-        protocol = self.protocol
-        return protocol.__class__.get_pickler(protocol, buffer)
+        return self.__protocol_get_pickler(buffer)
 
     def get_unpickler(self, buffer: IO[bytes]) -> Unpickler:
-        protocol = self.protocol
-        return protocol.__class__.get_unpickler(protocol, buffer)  # type: ignore[arg-type]
+        return self.__protocol_get_unpickler(buffer)
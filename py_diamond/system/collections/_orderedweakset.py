@@ -39,32 +39,33 @@ class OrderedWeakSet(WeakSet, Sequence):  # type: ignore[type-arg]
         if data is not None:
             self.update(data)
 
-    if TYPE_CHECKING:
-
-        def _commit_removals(self) -> None:  # Private method from WeakSet
-            ...
+    def _commit_removals(self) -> None:  # Private method from WeakSet
+        # Remove all the dead references at once: each OrderedSet.discard() call re-indexes the set
+        if pending := self._pending_removals:
+            self._pending_removals = []
+            self.data.difference_update(pending)
 
     def __getitem__(self, index: int | slice) -> Any | OrderedWeakSet:
         if self._pending_removals:
             self._commit_removals()
         if isinstance(index, slice):
+            new_set = self.__class__()
+            remove = new_set._remove  # type: ignore[attr-defined]
             with _IterationGuard(self):
-                return self.__class__((item for itemref in self.data[index] if (item := itemref()) is not None))  # type: ignore[operator, union-attr]
-        try:
-            if isinstance(index, str):  # type: ignore[unreachable]
-                raise TypeError
-            index = int(index)
-        except TypeError:
-            msg = f"indices must be integers or slices, not {type(index).__name__}"
-            raise TypeError(msg) from None
-        if index >= 0:
-            while (obj := self.data[index]()) is None:  # type: ignore[operator]
-                index += 1
-        else:
-            while (obj := self.data[index]()) is None:  # type: ignore[operator]
-                index += 1
-                if index == 0:
-                    raise IndexError("out of range")
+                # Only visit the requested range, without building an intermediate OrderedSet
+                itemrefs: Iterator[ReferenceType[Any]] = map(self.data.__getitem__, range(len(self.data))[index])
+                # The references of self cannot be shared: their callback removes them from self
+                new_set.data.update(ref(item, remove) for itemref in itemrefs if (item := itemref()) is not None)
+            return new_set
+        if type(index) is not int:
+            try:
+                index = index.__index__()
+            except AttributeError:
+                msg = f"indices must be integers or slices, not {type(index).__name__}"
+                raise TypeError(msg) from None
+        # Dead references are either discarded by their callback or pending removal (committed above)
+        if (obj := self.data[index]()) is None:  # type: ignore[operator]
+            raise IndexError("out of range")
         return obj
 
     def __delitem__(self, index: int) -> None:
@@ -73,6 +74,8 @@ class OrderedWeakSet(WeakSet, Sequence):  # type: ignore[type-arg]
         self.discard(self[index])
 
     def __reversed__(self) -> Iterator[object]:
+        if self._pending_removals:
+            self._commit_removals()
         with _IterationGuard(self):
             for itemref in reversed(self.data):
                 item = itemref()
@@ -82,7 +85,10 @@ class OrderedWeakSet(WeakSet, Sequence):  # type: ignore[type-arg]
                     yield item
 
     def count(self, value: Any) -> int:
-        return 1 if value in self else 0
+        try:
+            return 1 if ref(value) in self.data else 0
+        except TypeError:  # Not weakly referenceable
+            return 0
 
     def index(self, value: Any, *args: Any, **kwargs: Any) -> int:
         if self._pending_removals:
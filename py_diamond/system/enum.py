@@ -33,10 +33,10 @@ else:
 class AutoLowerNameEnum(StrEnum):
     @staticmethod
     def _generate_next_value_(name: str, start: int, count: int, last_values: list[str]) -> Any:
-        return name.lower()
+        return sys.intern(name.lower())
 
 
 class AutoUpperNameEnum(StrEnum):
     @staticmethod
     def _generate_next_value_(name: str, start: int, count: int, last_values: list[str]) -> Any:
-        return name.upper()
+        return sys.intern(name.upper())
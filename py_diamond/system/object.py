@@ -10,7 +10,7 @@ __all__ = ["Object", "ObjectMeta", "ProtocolObjectMeta", "final", "mro", "overri
 
 
 from abc import ABCMeta
-from functools import cached_property
+from functools import cached_property, partial
 from itertools import chain, takewhile
 from typing import TYPE_CHECKING, Any, Callable, TypeVar, overload
 
@@ -51,6 +51,15 @@ class ObjectMeta(ABCMeta):
         must_override = ObjectMeta.__must_override
         is_final_override = ObjectMeta.__is_final_override
 
+        # Scan the namespace once for both override() and final() markers
+        cls_must_override_methods: set[str] = set()
+        cls_final_methods: set[str] = set()
+        for attr_name, attr_obj in namespace.items():
+            if must_override(attr_obj):
+                cls_must_override_methods.add(attr_name)
+            if is_final_override(attr_obj):
+                cls_final_methods.add(attr_name)
+
         # Verify final bases
         final_bases: list[type]
         # Metaclasses can be decorated with @final, but this is the metaclass, not the base class
@@ -63,10 +72,11 @@ class ObjectMeta(ABCMeta):
         bases_final_methods_dict: dict[type, set[str]] = {
             base: {
                 method_name
-                for method_name in getattr(base, "__finalmethods__", ())
+                for method_name in base_final_methods
                 if not any(method_name in getattr(b, "__finalmethods__", ()) for b in base.__bases__)
             }
             for base in bases_mro
+            if (base_final_methods := getattr(base, "__finalmethods__", ()))
         }
         bases_final_methods_set: set[str] = set(chain.from_iterable(bases_final_methods_dict.values()))
 
@@ -98,16 +108,12 @@ class ObjectMeta(ABCMeta):
 
         # Verify override() decorator usage
         if methods_that_will_not_override := [
-            attr_name
-            for attr_name in {attr_name for attr_name, attr_obj in namespace.items() if must_override(attr_obj)}
-            if not any(hasattr(b, attr_name) for b in bases)
+            attr_name for attr_name in cls_must_override_methods if not any(hasattr(b, attr_name) for b in bases)
         ]:
             raise TypeError(
                 f"{name!r}: These methods will not override base method: {', '.join(map(repr, methods_that_will_not_override))}"
             )
 
-        # Retrieve final methods from namespace
-        cls_final_methods: set[str] = {attr_name for attr_name, attr_obj in namespace.items() if is_final_override(attr_obj)}
         cls.__finalmethods__ = frozenset(bases_final_methods_set | cls_final_methods)
 
         return cls
@@ -124,11 +130,11 @@ class ObjectMeta(ABCMeta):
 
     @staticmethod
     def __must_override(obj: Any) -> bool:
-        return bool(ObjectMeta.__check_attr(obj, "__mustoverride__"))
+        return ObjectMeta.__check_attr(obj, "__mustoverride__")
 
     @staticmethod
     def __is_final_override(obj: Any) -> bool:
-        return bool(ObjectMeta.__check_attr(obj, "__final__"))
+        return ObjectMeta.__check_attr(obj, "__final__")
 
     @staticmethod
     def __check_attr(obj: Any, attr: str) -> bool:
@@ -137,13 +143,13 @@ class ObjectMeta(ABCMeta):
                 return True
         except TypeError:  # Do not have __dict__ attribute
             pass
-        match obj:
-            case property(fget=fget, fset=fset, fdel=fdel):
-                return any(getattr(func, attr, False) for func in filter(callable, (fget, fset, fdel)))
-            case classmethod(__func__=func) | staticmethod(__func__=func) | cached_property(func=func):
-                return True if getattr(func, attr, False) else False
-            case _:
-                return False
+        if isinstance(obj, property):
+            return any(getattr(func, attr, False) for func in filter(callable, (obj.fget, obj.fset, obj.fdel)))
+        if isinstance(obj, (classmethod, staticmethod)):
+            return True if getattr(obj.__func__, attr, False) else False
+        if isinstance(obj, cached_property):
+            return True if getattr(obj.func, attr, False) else False
+        return False
 
 
 class Object(metaclass=ObjectMeta):
@@ -172,28 +178,31 @@ def override(*, final: bool = False) -> Callable[[_T], _T]:
 
 def override(f: Any = ..., /, *, final: bool = False) -> Any:
     final = bool(final)
-
-    def apply_markers(f: Any) -> None:
-        setattr(f, "__mustoverride__", True)
-        setattr(f, "__final__", final)
-
-    def decorator(f: Any) -> Any:
-        match f:
-            case property(fget=fget, fset=fset, fdel=fdel):
-                for func in filter(callable, (fget, fset, fdel)):
-                    apply_markers(func)
-            case classmethod(__func__=func) | staticmethod(__func__=func) | cached_property(func=func):
-                apply_markers(f)
-                apply_markers(func)
-            case type():
-                raise TypeError("override() must not decorate classes")
-            case _ if not callable(f) and not hasattr(f, "__get__"):
-                raise TypeError("override() must only decorate functions and descriptors")
-            case _:
-                apply_markers(f)
-        return f
-
-    return decorator if f is Ellipsis else decorator(f)
+    if f is Ellipsis:
+        return partial(_override_decorator, final)
+    return _override_decorator(final, f)
+
+
+def _override_decorator(final: bool, f: Any, /) -> Any:
+    match f:
+        case property(fget=fget, fset=fset, fdel=fdel):
+            for func in filter(callable, (fget, fset, fdel)):
+                _apply_override_markers(func, final)
+        case classmethod(__func__=func) | staticmethod(__func__=func) | cached_property(func=func):
+            _apply_override_markers(f, final)
+            _apply_override_markers(func, final)
+        case type():
+            raise TypeError("override() must not decorate classes")
+        case _ if not callable(f) and not hasattr(f, "__get__"):
+            raise TypeError("override() must only decorate functions and descriptors")
+        case _:
+            _apply_override_markers(f, final)
+    return f
+
+
+def _apply_override_markers(f: Any, final: bool) -> None:
+    setattr(f, "__mustoverride__", True)
+    setattr(f, "__final__", final)
 
 
 _MetaClassT = TypeVar("_MetaClassT", bound=type)
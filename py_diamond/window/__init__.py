@@ -94,6 +94,10 @@ __all__ = [
     "WindowTakeFocusEvent",
 ]
 
+from .._bootstrap import ensure_pygame
+
+ensure_pygame()
+
 import os
 
 import pygame
@@ -109,19 +113,133 @@ os.environ.setdefault("PYGAME_BLEND_ALPHA_SDL2", "1")
 os.environ.setdefault("SDL_VIDEO_CENTERED", "1")
 
 ############ Cleanup ############
-del os, pygame
+del os, pygame, ensure_pygame
 
 ############ Package initialization ############
-from .clickable import *
-from .clock import *
-from .cursor import *
-from .dialog import *
-from .display import *
-from .draggable import *
-from .event import *
-from .gui import *
-from .keyboard import *
-from .mouse import *
-from .scene import *
-from .time import *
-from .widget import *
+# The submodules are only imported when one of their names is accessed (PEP 562)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .clickable import *
+    from .clock import *
+    from .cursor import *
+    from .dialog import *
+    from .display import *
+    from .draggable import *
+    from .event import *
+    from .gui import *
+    from .keyboard import *
+    from .mouse import *
+    from .scene import *
+    from .time import *
+    from .widget import *
+
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "AbstractAutoLayeredDrawableScene": "scene",
+    "AbstractCursor": "cursor",
+    "AbstractLayeredScene": "scene",
+    "AbstractWidget": "widget",
+    "BoundFocus": "gui",
+    "BuiltinEvent": "event",
+    "BuiltinEventType": "event",
+    "BuiltinUserEventCode": "event",
+    "Clickable": "clickable",
+    "Clock": "clock",
+    "Cursor": "cursor",
+    "Dialog": "dialog",
+    "Draggable": "draggable",
+    "DraggingContainer": "draggable",
+    "DropBeginEvent": "event",
+    "DropCompleteEvent": "event",
+    "DropFileEvent": "event",
+    "DropTextEvent": "event",
+    "Event": "event",
+    "EventFactory": "event",
+    "EventFactoryError": "event",
+    "EventManager": "event",
+    "EventMeta": "event",
+    "FocusableContainer": "gui",
+    "GUIScene": "gui",
+    "JoyAxisMotionEvent": "event",
+    "JoyBallMotionEvent": "event",
+    "JoyButtonDownEvent": "event",
+    "JoyButtonEvent": "event",
+    "JoyButtonUpEvent": "event",
+    "JoyDeviceAddedEvent": "event",
+    "JoyDeviceRemovedEvent": "event",
+    "JoyHatMotionEvent": "event",
+    "KeyDownEvent": "event",
+    "KeyEvent": "event",
+    "KeyUpEvent": "event",
+    "Keyboard": "keyboard",
+    "MainScene": "scene",
+    "MainSceneMeta": "scene",
+    "Mouse": "mouse",
+    "MouseButtonDownEvent": "event",
+    "MouseButtonEvent": "event",
+    "MouseButtonUpEvent": "event",
+    "MouseEvent": "event",
+    "MouseMotionEvent": "event",
+    "MouseWheelEvent": "event",
+    "MusicEndEvent": "event",
+    "NoFocusSupportError": "gui",
+    "PopupDialog": "dialog",
+    "RenderedLayeredScene": "scene",
+    "ReturningSceneTransition": "scene",
+    "ReturningSceneTransitionProtocol": "scene",
+    "Scene": "scene",
+    "SceneMeta": "scene",
+    "SceneTransition": "scene",
+    "SceneTransitionCoroutine": "scene",
+    "SceneTransitionProtocol": "scene",
+    "SceneWindow": "scene",
+    "ScreenshotEvent": "event",
+    "SupportsFocus": "gui",
+    "SystemCursor": "cursor",
+    "TextEditingEvent": "event",
+    "TextEvent": "event",
+    "TextInputEvent": "event",
+    "Time": "time",
+    "UnknownEventTypeError": "event",
+    "UserEvent": "event",
+    "Window": "display",
+    "WindowCallback": "display",
+    "WindowEnterEvent": "event",
+    "WindowError": "display",
+    "WindowExit": "display",
+    "WindowExposedEvent": "event",
+    "WindowFocusGainedEvent": "event",
+    "WindowFocusLostEvent": "event",
+    "WindowHiddenEvent": "event",
+    "WindowLeaveEvent": "event",
+    "WindowMaximizedEvent": "event",
+    "WindowMinimizedEvent": "event",
+    "WindowMovedEvent": "event",
+    "WindowResizedEvent": "event",
+    "WindowRestoredEvent": "event",
+    "WindowShownEvent": "event",
+    "WindowSizeChangedEvent": "event",
+    "WindowTakeFocusEvent": "event",
+}
+
+
+def __getattr__(name: str) -> object:
+    from importlib import import_module
+
+    try:
+        submodule_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        if name not in _LAZY_ATTRIBUTES.values():
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+        return import_module(f".{name}", __name__)  # Submodule accessed as an attribute
+
+    obj: object = getattr(import_module(f".{submodule_name}", __name__), name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+del TYPE_CHECKING
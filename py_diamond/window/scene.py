@@ -551,12 +551,16 @@ class SceneWindow(Window):
         self.__accumulator: float = 0
         self.__reset_interpolation_data()
         self.__running: bool = False
-        self.__last_clear_color: Color | None = None
+        self.__last_clear_color: int | None = None
 
     @contextmanager
     def open(self) -> Iterator[None]:
         def cleanup() -> None:
             self.__scenes.clear()
+            # WindowCallback.kill() removes itself from the mapping: iterate over snapshots
+            for callback_list in tuple(self.__callback_after_scenes.values()):
+                for window_callback in tuple(callback_list):
+                    window_callback.kill()
             self.__callback_after_scenes.clear()
             self.__last_clear_color = None
             del self.__scenes
@@ -664,11 +668,12 @@ class SceneWindow(Window):
     def clear(self, color: _ColorValue = BLACK, *, blend_alpha: bool = False) -> None:
         color = Color(color)
         if not blend_alpha:
-            color = color.with_alpha(255)
-            if color == self.__last_clear_color:
-                cast("_WindowRenderer", self.renderer).repaint_color(color)
-                return
-        self.__last_clear_color = color
+            color.a = 255
+        packed_color: int = int(color)  # 0xRRGGBBAA
+        if not blend_alpha and packed_color == self.__last_clear_color:
+            cast("_WindowRenderer", self.renderer).repaint_color(color)
+            return
+        self.__last_clear_color = packed_color
         return super().clear(color, blend_alpha=blend_alpha)
 
     def refresh(self) -> float:
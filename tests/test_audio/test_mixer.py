@@ -108,6 +108,35 @@ class TestMixerUnit:
         # Assert
         mock_pygame_mixer_module.quit.assert_not_called()
 
+    @pytest.mark.usefixtures("mixer_init_default_side_effect")
+    def test__init__mixer_known_as_initialized_within_context(self, mock_pygame_mixer_module: MockMixerModule) -> None:
+        # Arrange
+
+        # Act & Assert
+        with Mixer.init():
+            mock_pygame_mixer_module.get_init.reset_mock()
+            assert Mixer._is_initialized()
+            mock_pygame_mixer_module.get_init.assert_not_called()
+
+        mock_pygame_mixer_module.get_init.side_effect = None
+        mock_pygame_mixer_module.get_init.return_value = None
+        assert not Mixer._is_initialized()
+
+    @pytest.mark.usefixtures("mixer_init_default_side_effect")
+    def test__init__pygame_mixer_quit_within_context_is_not_detected(self, mock_pygame_mixer_module: MockMixerModule) -> None:
+        # Arrange
+        ## Known limitation: Mixer._is_initialized() trusts the Mixer.init() context over the actual mixer state
+
+        # Act & Assert
+        with Mixer.init():
+            mock_pygame_mixer_module.get_init.side_effect = None
+            mock_pygame_mixer_module.get_init.return_value = None  # Simulate a direct call to pygame.mixer.quit()
+            mock_pygame_mixer_module.get_init.reset_mock()
+            assert Mixer._is_initialized()
+            mock_pygame_mixer_module.get_init.assert_not_called()
+
+        assert not Mixer._is_initialized()
+
     def test__get_init__return_mixer_params(self, mock_pygame_mixer_module: MockMixerModule, sentinel: Any) -> None:
         # Arrange
         mock_pygame_mixer_module.get_init.return_value = (
@@ -0,0 +1,410 @@
+# -*- coding: Utf-8 -*-
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from py_diamond.graphics.drawable import Drawable, DrawableGroup, LayeredDrawableGroup, MDrawable
+
+import pytest
+
+if TYPE_CHECKING:
+    from py_diamond.graphics.drawable import BaseDrawableGroup
+    from py_diamond.graphics.grid import Grid
+    from py_diamond.graphics.renderer import AbstractRenderer
+
+    from pytest_mock import MockerFixture
+
+
+class _DrawableFixture(Drawable):
+    def __init__(self, name: str) -> None:
+        super().__init__()
+        self.name: str = name
+
+    def draw_onto(self, target: AbstractRenderer) -> None:
+        pass
+
+    def __repr__(self) -> str:
+        return f"<{self.name}>"
+
+
+class _MovableDrawableFixture(MDrawable):
+    def draw_onto(self, target: AbstractRenderer) -> None:
+        pass
+
+    def get_size(self) -> tuple[float, float]:
+        return (10, 10)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("group_cls", [DrawableGroup, LayeredDrawableGroup])
+class TestDrawableGroupMembership:
+    def test__contains__after_add(self, group_cls: type[DrawableGroup]) -> None:
+        # Arrange
+        d1, d2 = _DrawableFixture("d1"), _DrawableFixture("d2")
+        group = group_cls(d1)
+
+        # Act
+        group.add(d2, d1)
+
+        # Assert
+        assert d1 in group and d2 in group
+        assert _DrawableFixture("d3") not in group
+        assert list(group) == [d1, d2]
+        assert group in d1.groups and group in d2.groups
+
+    def test__contains__after_remove(self, group_cls: type[DrawableGroup]) -> None:
+        # Arrange
+        d1, d2, d3 = (_DrawableFixture(f"d{i}") for i in range(1, 4))
+        group = group_cls(d1, d2, d3)
+
+        # Act
+        group.remove(d2)
+
+        # Assert
+        assert d2 not in group
+        assert d1 in group and d3 in group
+        assert group not in d2.groups
+
+    def test__contains__after_remove_several_objects(self, group_cls: type[DrawableGroup]) -> None:
+        # Arrange
+        d1, d2, d3 = (_DrawableFixture(f"d{i}") for i in range(1, 4))
+        group = group_cls(d1, d2, d3)
+
+        # Act
+        group.remove(d3, d1)
+
+        # Assert
+        assert d1 not in group and d3 not in group
+        assert d2 in group
+        assert list(group) == [d2]
+
+    def test__contains__after_pop(self, group_cls: type[DrawableGroup]) -> None:
+        # Arrange
+        d1, d2, d3 = (_DrawableFixture(f"d{i}") for i in range(1, 4))
+        group = group_cls(d1, d2, d3)
+
+        # Act
+        popped = group.pop(-3)
+
+        # Assert
+        assert popped is d1
+        assert d1 not in group
+        assert d2 in group and d3 in group
+
+    def test__contains__after_clear(self, group_cls: type[DrawableGroup]) -> None:
+        # Arrange
+        d1, d2 = _DrawableFixture("d1"), _DrawableFixture("d2")
+        group = group_cls(d1, d2)
+
+        # Act
+        group.clear()
+
+        # Assert
+        assert d1 not in group and d2 not in group
+        assert not group
+        group.add(d2)
+        assert d2 in group
+
+    def test__contains__after_kill(self, group_cls: type[DrawableGroup]) -> None:
+        # Arrange
+        d1, d2 = _DrawableFixture("d1"), _DrawableFixture("d2")
+        group = group_cls(d1, d2)
+
+        # Act
+        d1.kill()
+
+        # Assert
+        assert d1 not in group
+        assert d2 in group
+        group.add(d1)
+        assert d1 in group
+
+    def test__contains__after_remove_from_group(self, group_cls: type[DrawableGroup]) -> None:
+        # Arrange
+        d1 = _DrawableFixture("d1")
+        group = group_cls(d1)
+
+        # Act
+        d1.remove_from_group(group)
+
+        # Assert
+        assert d1 not in group
+        assert not group
+
+    @pytest.mark.parametrize("value", [[], {}, set()], ids=type)
+    def test__contains__unhashable_value(self, group_cls: type[DrawableGroup], value: object) -> None:
+        # Arrange
+        group = group_cls(_DrawableFixture("d1"))
+
+        # Act & Assert
+        assert value not in group
+
+
+@pytest.mark.unit
+class TestGridGroupMembership:
+    @pytest.fixture
+    @staticmethod
+    def grid(mocker: MockerFixture) -> Grid:
+        from py_diamond.graphics.grid import Grid
+
+        # The background and outline shapes need an initialized display
+        mocker.patch("py_diamond.graphics.grid.RectangleShape")
+        return Grid()
+
+    @staticmethod
+    def get_grid_group(grid: Grid) -> BaseDrawableGroup[Any]:
+        return getattr(grid, "_Grid__grid_group")
+
+    def test__contains__follow_grid_placement(self, grid: Grid) -> None:
+        # Arrange
+        group = self.get_grid_group(grid)
+        d1, d2 = _MovableDrawableFixture(), _MovableDrawableFixture()
+
+        # Act & Assert
+        grid.place(d1, 0, 0)
+        assert d1 in group
+        grid.place(d1, 0, 1)
+        assert d1 in group
+        grid.place(d2, 0, 1)  # Replace d1
+        assert d1 not in group and d2 in group
+        assert list(group) == [d2]
+        grid.remove(d2)
+        assert d2 not in group
+        assert not group
+
+    def test__contains__after_pop_and_clear(self, grid: Grid) -> None:
+        # Arrange
+        group = self.get_grid_group(grid)
+        d1, d2 = _MovableDrawableFixture(), _MovableDrawableFixture()
+        grid.place(d1, 0, 0)
+        grid.place(d2, 1, 0)
+
+        # Act & Assert
+        assert grid.pop(0, 0) is d1
+        assert d1 not in group and d2 in group
+        grid.clear()
+        assert d2 not in group
+
+    def test__contains__after_kill(self, grid: Grid) -> None:
+        # Arrange
+        group = self.get_grid_group(grid)
+        d1 = _MovableDrawableFixture()
+        grid.place(d1, 0, 0)
+
+        # Act
+        d1.kill()
+
+        # Assert
+        assert d1 not in group
+        assert d1 not in grid
+
+
+@pytest.mark.unit
+class TestLayeredDrawableGroup:
+    @pytest.fixture
+    @staticmethod
+    def group() -> LayeredDrawableGroup:
+        return LayeredDrawableGroup()
+
+    @staticmethod
+    def assert_layers_consistency(group: LayeredDrawableGroup) -> None:
+        layers = [group.get_layer(d) for d in group]
+        assert layers == sorted(layers)
+        if layers:
+            assert group.get_bottom_layer() == layers[0]
+            assert group.get_top_layer() == layers[-1]
+        for layer in set(layers):
+            assert group.get_from_layer(layer) == [d for d in group if group.get_layer(d) == layer]
+
+    def test__add__sort_by_layer_and_keep_insertion_order_within_a_layer(self, group: LayeredDrawableGroup) -> None:
+        # Arrange
+        d1, d2, d3, d4, d5, d6 = (_DrawableFixture(f"d{i}") for i in range(1, 7))
+
+        # Act
+        group.add(d1, layer=2)
+        group.add(d2, layer=-1)
+        group.add(d3)
+        group.add(d4, d5, layer=2)
+        group.add(d6, layer=-1)
+
+        # Assert
+        assert list(group) == [d2, d6, d3, d1, d4, d5]
+        assert group.get_bottom_drawable() is d2
+        assert group.get_top_drawable() is d5
+        assert group.layers == [-1, 0, 2]
+        self.assert_layers_consistency(group)
+
+    def test__add__ignore_objects_already_in_group(self, group: LayeredDrawableGroup) -> None:
+        # Arrange
+        d1, d2 = _DrawableFixture("d1"), _DrawableFixture("d2")
+        group.add(d1, d2, layer=1)
+
+        # Act
+        group.add(d1, layer=5)
+
+        # Assert
+        assert list(group) == [d1, d2]
+        assert group.get_layer(d1) == 1
+        self.assert_layers_consistency(group)
+
+    @pytest.mark.parametrize("top_of_layer", [True, False], ids=lambda top: f"top_of_layer={top}")
+    def test__change_layer__insert_at_top_or_bottom_of_layer(self, top_of_layer: bool, group: LayeredDrawableGroup) -> None:
+        # Arrange
+        d1, d2, d3, d4 = (_DrawableFixture(f"d{i}") for i in range(1, 5))
+        group.add(d1, d2, layer=1)
+        group.add(d3, layer=3)
+        group.add(d4, layer=0)
+
+        # Act
+        group.change_layer(d4, 1, top_of_layer=top_of_layer)
+
+        # Assert
+        if top_of_layer:
+            assert list(group) == [d1, d2, d4, d3]
+        else:
+            assert list(group) == [d4, d1, d2, d3]
+        assert group.get_layer(d4) == 1
+        assert group.get_from_layer(0) == []
+        self.assert_layers_consistency(group)
+
+    def test__change_layer__unknown_object(self, group: LayeredDrawableGroup) -> None:
+        # Arrange
+        group.add(_DrawableFixture("d1"))
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            group.change_layer(_DrawableFixture("unknown"), 4)
+
+    def test__move_to_front__move_to_back(self, group: LayeredDrawableGroup) -> None:
+        # Arrange
+        d1, d2, d3 = (_DrawableFixture(f"d{i}") for i in range(1, 4))
+        group.add(d1, layer=0)
+        group.add(d2, layer=1)
+        group.add(d3, layer=2)
+
+        # Act & Assert
+        group.move_to_front(d1)
+        assert list(group) == [d2, d3, d1]
+        group.move_to_back(d1)
+        assert list(group) == [d1, d2, d3]
+        assert group.get_layer(d1) == 0
+        self.assert_layers_consistency(group)
+
+    @pytest.mark.parametrize("index", [-1, -2, -4, 0, 2])
+    def test__pop__keep_layers_consistent(self, index: int, group: LayeredDrawableGroup) -> None:
+        # Arrange
+        drawables = [_DrawableFixture(f"d{i}") for i in range(1, 6)]
+        for layer, d in zip([3, -2, 3, 0, 7], drawables):
+            group.add(d, layer=layer)
+        expected_list = list(group)
+        expected_popped = expected_list.pop(index)
+
+        # Act
+        popped = group.pop(index)
+
+        # Assert
+        assert popped is expected_popped
+        assert list(group) == expected_list
+        assert popped not in group
+        assert group not in popped.groups
+        with pytest.raises(ValueError):
+            group.get_layer(popped)
+        self.assert_layers_consistency(group)
+
+    def test__pop__last_drawable_of_top_layer(self, group: LayeredDrawableGroup) -> None:
+        # Arrange
+        d1, d2 = _DrawableFixture("d1"), _DrawableFixture("d2")
+        group.add(d1, layer=1)
+        group.add(d2, layer=10)
+
+        # Act
+        group.pop(-1)
+
+        # Assert
+        assert group.get_top_layer() == 1
+        assert group.get_bottom_layer() == 1
+
+    def test__remove__several_objects(self, group: LayeredDrawableGroup) -> None:
+        # Arrange
+        drawables = [_DrawableFixture(f"d{i}") for i in range(1, 7)]
+        for layer, d in zip([1, 0, 1, 2, 0, 1], drawables):
+            group.add(d, layer=layer)
+        d1, d2, d3, d4, d5, d6 = drawables
+
+        # Act
+        group.remove(d3, d5, d4)
+
+        # Assert
+        assert list(group) == [d2, d1, d6]
+        for d in (d3, d4, d5):
+            assert d not in group
+            assert group not in d.groups
+        assert group.get_from_layer(2) == []
+        assert group.get_top_layer() == 1
+        self.assert_layers_consistency(group)
+
+    def test__remove__do_not_remove_anything_if_an_object_is_unknown(self, group: LayeredDrawableGroup) -> None:
+        # Arrange
+        d1, d2 = _DrawableFixture("d1"), _DrawableFixture("d2")
+        group.add(d1, d2)
+
+        # Act
+        with pytest.raises(ValueError):
+            group.remove(d1, _DrawableFixture("unknown"))
+
+        # Assert
+        assert list(group) == [d1, d2]
+        self.assert_layers_consistency(group)
+
+    def test__remove_from_layer(self, group: LayeredDrawableGroup) -> None:
+        # Arrange
+        d1, d2, d3 = (_DrawableFixture(f"d{i}") for i in range(1, 4))
+        group.add(d1, d3, layer=1)
+        group.add(d2, layer=2)
+
+        # Act
+        removed = group.remove_from_layer(1)
+
+        # Assert
+        assert removed == [d1, d3]
+        assert list(group) == [d2]
+        self.assert_layers_consistency(group)
+
+    def test__kill__remove_from_layered_groups(self) -> None:
+        # Arrange
+        group1, group2 = LayeredDrawableGroup(), LayeredDrawableGroup()
+        d1, d2, d3 = (_DrawableFixture(f"d{i}") for i in range(1, 4))
+        group1.add(d1, d2, d3, layer=4)
+        group2.add(d2, layer=-3)
+        group2.add(d3, layer=8)
+
+        # Act
+        d2.kill()
+
+        # Assert
+        assert not d2.is_alive()
+        assert list(group1) == [d1, d3]
+        assert list(group2) == [d3]
+        assert d2 not in group1 and d2 not in group2
+        with pytest.raises(ValueError):
+            group2.get_layer(d2)
+        assert group2.get_bottom_layer() == 8
+        self.assert_layers_consistency(group1)
+        self.assert_layers_consistency(group2)
+
+    def test__clear(self, group: LayeredDrawableGroup) -> None:
+        # Arrange
+        d1, d2 = _DrawableFixture("d1"), _DrawableFixture("d2")
+        group.add(d1, layer=3)
+        group.add(d2, layer=-3)
+
+        # Act
+        group.clear()
+        group.add(d1)
+
+        # Assert
+        assert list(group) == [d1]
+        assert group.get_layer(d1) == 0
+        assert not d2.is_alive()
+        self.assert_layers_consistency(group)
@@ -58,7 +58,8 @@ class TestGlobalImport:
         assert isinstance(getattr(py_diamond, module_name), ModuleType)
         assert module_fullname in sys.modules
 
-    def test__import__raise_custom_message_if_pygame_is_not_installed(self, mocker: MockerFixture) -> None:
+    @pytest.mark.parametrize("module_name", ["audio", "graphics", "math", "window"], ids=lambda name: f"py_diamond.{name}")
+    def test__import__raise_custom_message_if_pygame_is_not_installed(self, module_name: str, mocker: MockerFixture) -> None:
         # Forbid import of pygame
         original_import = __import__
 
@@ -71,10 +72,21 @@ class TestGlobalImport:
         mocker.patch("builtins.__import__", import_mock)
 
         # Begin test
+        import py_diamond  # pygame is not needed here
+
         with pytest.raises(ModuleNotFoundError, match=r"'pygame' package must be installed in order to use the PyDiamond engine"):
-            import py_diamond
+            getattr(py_diamond, module_name)
 
-            del py_diamond
+        del py_diamond
+
+    def test__import__do_not_import_pygame_with_the_main_package(self) -> None:
+        import sys
+
+        import py_diamond
+
+        assert not any(n == "pygame" or n.startswith("pygame.") for n in tuple(sys.modules))
+
+        del py_diamond
 
     def test__import__raise_warning_if_pygame_is_already_imported(self) -> None:
         import pygame
@@ -108,6 +120,56 @@ class TestGlobalImport:
 
         del pygame
 
+    def test__import__do_not_record_patches_by_default(self) -> None:
+        import py_diamond
+
+        assert py_diamond.__patches__ == frozenset()
+
+        del py_diamond
+
+    def test__import__record_patches_if_environment_variable_is_set(self, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv("PYDIAMOND_PATCH_DEBUG", "1")
+
+        import py_diamond
+
+        assert py_diamond.__patches__
+        patches_before_pygame = py_diamond.__patches__
+
+        getattr(py_diamond, "graphics")  # Import pygame
+
+        assert py_diamond.__patches__ > patches_before_pygame
+
+        del py_diamond
+
+    @pytest.mark.parametrize("eager_import", [False, True], ids=lambda eager: f"PYDIAMOND_EAGER_IMPORT={int(eager)}")
+    def test__import__run_patch_contexts_in_order(
+        self, eager_import: bool, monkeypatch: MonkeyPatch, mocker: MockerFixture
+    ) -> None:
+        import sys
+
+        from py_diamond._patch import PatchContext, collector
+
+        # Reload the package, but keep the patch collector in order to spy on it
+        for module_name in tuple(sys.modules):
+            if module_name == "py_diamond" or (
+                module_name.startswith("py_diamond.") and not module_name.startswith("py_diamond._patch")
+            ):
+                monkeypatch.delitem(sys.modules, module_name)
+        monkeypatch.setenv("PYDIAMOND_EAGER_IMPORT", str(int(eager_import)))
+        run_patches_spy = mocker.spy(collector, "run_patches")
+
+        def called_contexts() -> list[PatchContext]:
+            return [call.args[0] for call in run_patches_spy.call_args_list]
+
+        py_diamond = import_module("py_diamond")
+
+        if not eager_import:
+            assert called_contexts() == [PatchContext.BEFORE_ALL, PatchContext.BEFORE_IMPORTING_PYGAME]
+            getattr(py_diamond, "graphics")  # Import pygame
+        getattr(py_diamond, "window")  # Must not run the patches again
+
+        assert called_contexts() == list(PatchContext)
+
     def test__import__raise_error_for_incompatible_python_version(self, mocker: MockerFixture) -> None:
         mocker.patch("sys.version_info", MockVersionInfo(3, 9, 5, "final", 0))
 
@@ -210,23 +272,23 @@ class TestStarImports:
         # Arrange
         module = import_module(f"py_diamond.{module_name}")
         submodule = import_module(f"py_diamond.{module_name}.{submodule_name}")
-        module_namespace = vars(module)
         __all_module__: list[str] = module.__all__
         __all_submodule__: list[str] = submodule.__all__
 
         # Act
         missing_names_in_declaration = set(__all_submodule__) - set(__all_module__)
-        missing_names_in_namespace = set(__all_submodule__) - set(module_namespace)
+        missing_names_in_namespace = {name for name in __all_submodule__ if not hasattr(module, name)}  # Names can be lazy loaded
 
         # Assert
         assert not missing_names_in_namespace
         assert not missing_names_in_declaration
+        for name in __all_submodule__:
+            assert getattr(module, name) is getattr(submodule, name)
 
     @pytest.mark.parametrize("module_name", _catch_all_py_diamond_packages_and_modules())
     def test__all__values_declared_exists_in_namespace(self, module_name: str) -> None:
         # Arrange
         module = import_module(module_name)
-        module_namespace = vars(module)
         try:
             __all_module__: list[str] = module.__all__
         except AttributeError:
@@ -235,7 +297,7 @@ class TestStarImports:
             pytest.fail(f"{module_name!r}: Duplicates found in __all__")
 
         # Act
-        unknown_names = set(__all_module__) - set(module_namespace)
+        unknown_names = {name for name in __all_module__ if not hasattr(module, name)}  # Names can be lazy loaded
 
         # Assert
         assert not unknown_names
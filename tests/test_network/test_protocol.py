@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Generator
 
 from py_diamond.network.protocol import EncryptorNetworkProtocol, JSONNetworkProtocol, PickleNetworkProtocol
+from py_diamond.system.utils.itertools import consumer_start
 
 import pytest
 from cryptography.fernet import Fernet, InvalidToken
@@ -19,6 +20,50 @@ def test_pickling_protocol() -> None:
     assert protocol.deserialize(serialized_d) == d
 
 
+def _incremental_deserialize(protocol: PickleNetworkProtocol[Any, Any], chunks: list[bytes]) -> tuple[Any, bytes]:
+    consumer: Generator[None, bytes, tuple[Any, bytes]] = protocol.incremental_deserialize()
+    consumer_start(consumer)
+    for chunk in chunks:
+        try:
+            consumer.send(chunk)
+        except StopIteration as exc:
+            return exc.value
+    pytest.fail("Packet not deserialized")
+
+
+def test_pickling_protocol_incremental_deserialize_chunked_data() -> None:
+    d: dict[str, Any] = {"key": [1, 2, 3], "value": True}
+    protocol: PickleNetworkProtocol[Any, Any] = PickleNetworkProtocol()
+    serialized_d: bytes = protocol.serialize(d)
+    assert serialized_d.find(b".") == len(serialized_d) - 1  # Only the STOP opcode
+
+    chunks: list[bytes] = [serialized_d[i : i + 4] for i in range(0, len(serialized_d), 4)]
+    chunks[-1] += b"remaining data"
+
+    packet, remaining = _incremental_deserialize(protocol, chunks)
+
+    assert packet == d
+    assert remaining == b"remaining data"
+
+
+def test_pickling_protocol_incremental_deserialize_flush_corrupted_data() -> None:
+    d: dict[str, Any] = {"key": [1, 2, 3], "value": True}
+    protocol: PickleNetworkProtocol[Any, Any] = PickleNetworkProtocol()
+    serialized_d: bytes = protocol.serialize(d)
+    assert serialized_d.find(b".") == len(serialized_d) - 1  # Only the STOP opcode
+
+    chunks: list[bytes] = [
+        b"\xffcorrupted." + serialized_d[:5],  # The beginning of the valid packet must be kept
+        serialized_d[5:20],
+        serialized_d[20:] + b"remaining.data",
+    ]
+
+    packet, remaining = _incremental_deserialize(protocol, chunks)
+
+    assert packet == d
+    assert remaining == b"remaining.data"
+
+
 def test_json_protocol() -> None:
     protocol: JSONNetworkProtocol[Any, Any] = JSONNetworkProtocol()
     d: bytes = protocol.serialize({"key": [1, 2], "value": True})
@@ -54,3 +54,30 @@ class TestPatchCommon:
         expected_context = PatchContext[self.EXPECTED_CONTEXT[patch_qualname]]
 
         assert patch_cls.get_required_context() is expected_context
+
+    def test__patch__disabled_from_environment(
+        self,
+        patch_cls: type[BasePatch],
+        patch_qualname: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        from py_diamond._patch._base import RequiredPatch
+
+        from ..mock.sys import unload_module
+
+        if issubclass(patch_cls, RequiredPatch):
+            pytest.skip("Required patches cannot be disabled")
+
+        # Arrange
+        unload_module("py_diamond._patch", include_submodules=True, monkeypatch=monkeypatch)
+        monkeypatch.setenv("PYDIAMOND_PATCH_DISABLE", f"plugins.{patch_qualname}")
+        module_path, _, patch_name = patch_qualname.rpartition(".")
+
+        # Act
+        reloaded_patch_cls: type[BasePatch] = getattr(
+            importlib.import_module(f"py_diamond._patch.plugins.{module_path}"), patch_name
+        )
+
+        # Assert
+        assert reloaded_patch_cls is not patch_cls
+        assert not reloaded_patch_cls.enabled()
@@ -121,3 +121,46 @@ def test_index() -> None:
     del d4
 
     assert dset.index(d5) == 3
+
+
+def test_get_item_after_pending_removals() -> None:
+    d1 = Dummy()
+    d2 = Dummy()
+    d3 = Dummy()
+
+    dset = OrderedWeakSet([d1, d2, d3])
+
+    iterator = iter(dset)
+    next(iterator)  # References dying during an iteration are kept as pending removals
+    del d1, d2
+    iterator.close()
+
+    assert dset[0] is d3
+    assert dset[-1] is d3
+    with pytest.raises(IndexError):
+        dset[1]
+
+
+@pytest.mark.parametrize("index", [slice(3, 9), slice(-6, -1), slice(1, 15, 3), slice(12, 2, -2)], ids=repr)
+def test_get_item_slice_sub_range(index: slice) -> None:
+    dummies = [Dummy() for _ in range(20)]
+    dset = OrderedWeakSet(dummies)
+
+    iterator = iter(dset)
+    next(iterator)  # Keep some dead references pending until the slice
+    del dummies[4], dummies[10], dummies[11]
+    iterator.close()
+    del dummies[6]
+
+    sub_set = dset[index]
+    expected = dummies[index]
+
+    assert isinstance(sub_set, OrderedWeakSet)
+    assert list(sub_set) == expected
+
+    # The new set must follow the deaths of its own items
+    removed = expected.pop(0)
+    dummies.remove(removed)
+    del removed
+    assert list(sub_set) == expected
+    assert len(dset) == len(dummies)